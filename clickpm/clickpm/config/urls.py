@@ -2,19 +2,17 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from django.http import HttpResponse
 from pm.views.home_views import HomeView
 
-def favicon(request):
-    return HttpResponse(status=204)  # No content
-
+# URL resolution is a linear scan, so the busiest prefix goes first
 urlpatterns = [
-    path('', HomeView.as_view(), name='home'),
-    path('admin/', admin.site.urls),
     path('api/', include('pm.urls')),
-    path('favicon.ico', favicon),
+    path('admin/', admin.site.urls),
+    path('', HomeView.as_view(), name='home'),
 ]
 
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+    urlpatterns += [
+        *static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT),
+        *static(settings.STATIC_URL, document_root=settings.STATIC_ROOT),
+    ]
@@ -21,6 +21,7 @@ class RoleAdmin(admin.ModelAdmin):
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
     list_display = ['username', 'email', 'role', 'is_suspended', 'is_active']
+    list_select_related = ('role',)
     list_filter = ['is_active', 'is_suspended', 'role', 'date_joined']
     search_fields = ['username', 'email', 'first_name', 'last_name']
     readonly_fields = ['date_joined']
@@ -31,6 +32,7 @@ class UserAdmin(admin.ModelAdmin):
 @admin.register(Workspace)
 class WorkspaceAdmin(admin.ModelAdmin):
     list_display = ['name', 'owner', 'created_at', 'updated_at']
+    list_select_related = ('owner',)
     list_filter = ['created_at', 'owner']
     search_fields = ['name', 'description', 'owner__username']
     readonly_fields = ['created_at', 'updated_at']
@@ -38,6 +40,7 @@ class WorkspaceAdmin(admin.ModelAdmin):
 @admin.register(WorkspaceMember)
 class WorkspaceMemberAdmin(admin.ModelAdmin):
     list_display = ['user', 'workspace', 'is_admin', 'joined_at']
+    list_select_related = ('user', 'workspace')
     list_filter = ['is_admin', 'joined_at']
     search_fields = ['user__username', 'workspace__name']
     readonly_fields = ['joined_at']
@@ -48,6 +51,7 @@ class WorkspaceMemberAdmin(admin.ModelAdmin):
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     list_display = ['name', 'workspace', 'status', 'start_date', 'end_date', 'archived']
+    list_select_related = ('workspace',)
     list_filter = ['status', 'archived', 'start_date', 'workspace']
     search_fields = ['name', 'description']
     readonly_fields = ['created_at', 'updated_at']
@@ -55,12 +59,14 @@ class ProjectAdmin(admin.ModelAdmin):
 @admin.register(ProjectMember)
 class ProjectMemberAdmin(admin.ModelAdmin):
     list_display = ['user', 'project', 'role', 'joined_at']
+    list_select_related = ('user', 'project', 'role')
     list_filter = ['role', 'joined_at']
     search_fields = ['user__username', 'project__name']
 
 @admin.register(Milestone)
 class MilestoneAdmin(admin.ModelAdmin):
     list_display = ['name', 'project', 'status', 'start_date', 'end_date']
+    list_select_related = ('project',)
     list_filter = ['status', 'project', 'start_date', 'end_date']
     search_fields = ['name', 'project__name', 'description']
     readonly_fields = ['created_at', 'updated_at']
@@ -68,6 +74,7 @@ class MilestoneAdmin(admin.ModelAdmin):
 @admin.register(Sprint)
 class SprintAdmin(admin.ModelAdmin):
     list_display = ['name', 'milestone', 'status', 'start_date', 'end_date']
+    list_select_related = ('milestone__project',)
     list_filter = ['status', 'milestone', 'start_date', 'end_date']
     search_fields = ['name', 'milestone__name', 'description']
     readonly_fields = ['created_at', 'updated_at']
@@ -78,6 +85,7 @@ class SprintAdmin(admin.ModelAdmin):
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ['title', 'sprint', 'assignee', 'status', 'priority', 'due_date']
+    list_select_related = ('sprint__milestone', 'assignee')
     list_filter = ['status', 'priority', 'sprint', 'due_date']
     search_fields = ['title', 'description', 'assignee__username']
     readonly_fields = ['created_at', 'updated_at']
@@ -103,6 +111,7 @@ class TaskAdmin(admin.ModelAdmin):
 @admin.register(TaskDependency)
 class TaskDependencyAdmin(admin.ModelAdmin):
     list_display = ['task', 'depends_on', 'type']
+    list_select_related = ('task', 'depends_on')
     list_filter = ['type']
     search_fields = ['task__title', 'depends_on__title']
 
@@ -112,6 +121,7 @@ class TaskDependencyAdmin(admin.ModelAdmin):
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ['author', 'created_at', 'task', 'sprint', 'project']
+    list_select_related = ('author', 'task', 'sprint__milestone', 'project')
     list_filter = ['created_at', 'author']
     search_fields = ['content', 'author__username']
     readonly_fields = ['created_at', 'updated_at']
@@ -119,6 +129,7 @@ class CommentAdmin(admin.ModelAdmin):
 @admin.register(Attachment)
 class AttachmentAdmin(admin.ModelAdmin):
     list_display = ['file', 'comment', 'uploaded_at']
+    list_select_related = ('comment__author',)
     list_filter = ['uploaded_at']
     search_fields = ['file']
     readonly_fields = ['uploaded_at']
@@ -129,8 +140,9 @@ class AttachmentAdmin(admin.ModelAdmin):
 @admin.register(ActivityLog)
 class ActivityLogAdmin(admin.ModelAdmin):
     list_display = ['user', 'action', 'content_type', 'object_id', 'get_entity_name', 'short_reason', 'timestamp']
+    list_select_related = ('user',)
     list_filter = ['action', 'content_type', 'timestamp', 'user']
-    search_fields = ['user__username', 'action', 'content_type', 'reason']
+    search_fields = ['user__username', 'action', 'content_type', 'entity_name', 'reason']
     readonly_fields = ['user', 'action', 'content_type', 'object_id', 'reason', 
                        'old_value', 'new_value', 'extra_info', 'timestamp']
     ordering = ['-timestamp']
@@ -153,32 +165,24 @@ class ActivityLogAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
-    
+
     def get_entity_name(self, obj):
-        """Get entity name from extra_info"""
-        if obj.extra_info:
-            for key in ['task_title', 'sprint_name', 'milestone_name', 'project_name', 'workspace_name']:
-                if key in obj.extra_info:
-                    return obj.extra_info[key]
-        return f'#{obj.object_id}'
+        """Get entity name denormalized from extra_info"""
+        return obj.entity_name or f'#{obj.object_id}'
     get_entity_name.short_description = 'Entity'
-    
-    def short_reason(self, obj):
-        """Truncated reason for list display"""
-        if obj.reason:
-            return obj.reason[:50] + '...' if len(obj.reason) > 50 else obj.reason
-        return '-'
-    short_reason.short_description = 'Reason'
+    get_entity_name.admin_order_field = 'entity_name'
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
     list_display = ['recipient', 'actor', 'notification_type', 'verb', 'read', 'timestamp']
+    list_select_related = ('recipient', 'actor')
     list_filter = ['notification_type', 'read', 'timestamp']
     search_fields = ['recipient__username', 'actor__username', 'verb']
     readonly_fields = ['timestamp']
     actions = ['mark_as_read']
 
     def mark_as_read(self, request, queryset):
-        updated = queryset.update(read=True)
+        # Only touch rows that are actually unread
+        updated = queryset.filter(read=False).update(read=True)
         self.message_user(request, f'{updated} notifications marked as read.')
     mark_as_read.short_description = 'Mark selected notifications as read'
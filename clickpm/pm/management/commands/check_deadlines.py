@@ -1,13 +1,17 @@
+from collections import defaultdict
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from django.conf import settings
 from datetime import timedelta
 from pm.models.task_models import Task
-from pm.models.project_models import Sprint, Milestone, Project
+from pm.models.project_models import Sprint, Milestone, Project, ProjectMember
 from pm.models.notification_models import Notification
 from pm.services.notification_service import NotificationService
 from django.contrib.contenttypes.models import ContentType
 
+# Rows fetched per round-trip while streaming the deadline querysets
+CHUNK_SIZE = 500
+
 
 class Command(BaseCommand):
     help = 'Check for upcoming deadlines and create notifications with email alerts'
@@ -34,97 +38,121 @@ class Command(BaseCommand):
         self.stdout.write(f'Checking for deadlines on {target_date}...')
         self.stdout.write(f'Email notifications: {"enabled" if send_email else "disabled"}')
 
-        total_notifications = 0
+        cutoff = timezone.now() - timedelta(hours=24)
+        content_types = ContentType.objects.get_for_models(Task, Sprint, Milestone, Project)
 
-        # Check Tasks
         tasks_due = Task.objects.filter(
             due_date=target_date,
             assignee__isnull=False
-        ).exclude(status='Done')
-
-        for task in tasks_due:
-            if not self._notification_exists(task.assignee, task):
-                NotificationService.notify_deadline(
-                    recipient=task.assignee,
-                    target=task,
-                    target_type='task',
-                    days_until=days_ahead
-                )
-                total_notifications += 1
-
-        self.stdout.write(f'  Tasks: {tasks_due.count()} due, {total_notifications} new notifications')
-
-        # Check Sprints
-        sprints_ending = Sprint.objects.filter(end_date=target_date).exclude(status='Completed')
-        sprint_notifications = 0
-
-        for sprint in sprints_ending:
-            if sprint.milestone and sprint.milestone.project:
-                project = sprint.milestone.project
-                for member in project.members.all():
-                    if not self._notification_exists(member, sprint):
-                        NotificationService.notify_deadline(
-                            recipient=member,
-                            target=sprint,
-                            target_type='sprint',
-                            days_until=days_ahead
-                        )
-                        sprint_notifications += 1
-
-        total_notifications += sprint_notifications
-        self.stdout.write(f'  Sprints: {sprints_ending.count()} ending, {sprint_notifications} notifications')
-
-        # Check Milestones
-        milestones_ending = Milestone.objects.filter(end_date=target_date).exclude(status='Completed')
-        milestone_notifications = 0
-
-        for milestone in milestones_ending:
-            if milestone.project:
-                for member in milestone.project.members.all():
-                    if not self._notification_exists(member, milestone):
-                        NotificationService.notify_deadline(
-                            recipient=member,
-                            target=milestone,
-                            target_type='milestone',
-                            days_until=days_ahead
-                        )
-                        milestone_notifications += 1
-
-        total_notifications += milestone_notifications
-        self.stdout.write(f'  Milestones: {milestones_ending.count()} ending, {milestone_notifications} notifications')
-
-        # Check Projects
-        projects_ending = Project.objects.filter(end_date=target_date).exclude(status='Completed')
-        project_notifications = 0
-
-        for project in projects_ending:
-            for member in project.members.all():
-                if not self._notification_exists(member, project):
-                    NotificationService.notify_deadline(
-                        recipient=member,
-                        target=project,
-                        target_type='project',
-                        days_until=days_ahead
-                    )
-                    project_notifications += 1
-
-        total_notifications += project_notifications
-        self.stdout.write(f'  Projects: {projects_ending.count()} ending, {project_notifications} notifications')
+        ).exclude(status='Done').values(
+            'id', 'title', 'due_date', 'assignee_id', 'assignee__username', 'assignee__email'
+        )
+        sprints_ending = Sprint.objects.filter(
+            end_date=target_date
+        ).exclude(status='Completed').values('id', 'name', 'end_date', 'milestone__project_id')
+        milestones_ending = Milestone.objects.filter(
+            end_date=target_date
+        ).exclude(status='Completed').values('id', 'name', 'end_date', 'project_id')
+        projects_ending = Project.objects.filter(
+            end_date=target_date
+        ).exclude(status='Completed').values('id', 'name', 'end_date')
+
+        task_count, task_deadlines = self._task_deadlines(
+            tasks_due, content_types[Task], cutoff
+        )
+        sprint_count, sprint_deadlines = self._member_deadlines(
+            sprints_ending, 'milestone__project_id', 'sprint', content_types[Sprint], cutoff
+        )
+        milestone_count, milestone_deadlines = self._member_deadlines(
+            milestones_ending, 'project_id', 'milestone', content_types[Milestone], cutoff
+        )
+        project_count, project_deadlines = self._member_deadlines(
+            projects_ending, 'id', 'project', content_types[Project], cutoff
+        )
+
+        self.stdout.write(f'  Tasks: {task_count} due, {len(task_deadlines)} new notifications')
+        self.stdout.write(f'  Sprints: {sprint_count} ending, {len(sprint_deadlines)} notifications')
+        self.stdout.write(f'  Milestones: {milestone_count} ending, {len(milestone_deadlines)} notifications')
+        self.stdout.write(f'  Projects: {project_count} ending, {len(project_deadlines)} notifications')
+
+        deadlines = task_deadlines + sprint_deadlines + milestone_deadlines + project_deadlines
+
+        created = NotificationService.bulk_notify_deadline(
+            deadlines,
+            days_until=days_ahead,
+            send_email=send_email
+        )
+        total_notifications = len(created)
 
         self.stdout.write(self.style.SUCCESS(
             f'Deadline check completed! Total: {total_notifications} notifications created.'
         ))
 
-    def _notification_exists(self, recipient, target):
+    def _task_deadlines(self, tasks_due, content_type, cutoff):
+        """
+        Return (task count, deadline tuples) for tasks whose assignee has
+        not been notified since the cutoff.
         """
-        Check if a deadline notification already exists for this target and recipient
-        within the last 24 hours.
+        existing = self._existing_notifications(content_type, tasks_due, cutoff)
+        deadlines = []
+        count = 0
+
+        for task in tasks_due.iterator(chunk_size=CHUNK_SIZE):
+            count += 1
+            if (task['assignee_id'], task['id']) not in existing:
+                recipient = {
+                    'id': task['assignee_id'],
+                    'username': task['assignee__username'],
+                    'email': task['assignee__email'],
+                }
+                target = {'id': task['id'], 'name': task['title'], 'due_date': task['due_date']}
+                deadlines.append((recipient, target, 'task', content_type))
+
+        return count, deadlines
+
+    def _member_deadlines(self, targets, project_field, target_type, content_type, cutoff):
         """
-        content_type = ContentType.objects.get_for_model(target)
-        return Notification.objects.filter(
-            recipient=recipient,
+        Return (target count, deadline tuples) notifying every member of the
+        target's project who has not been notified since the cutoff.
+        """
+        existing = self._existing_notifications(content_type, targets, cutoff)
+        members = self._members_by_project(targets.values(project_field))
+        deadlines = []
+        count = 0
+
+        for row in targets.iterator(chunk_size=CHUNK_SIZE):
+            count += 1
+            target = {'id': row['id'], 'name': row['name'], 'due_date': row['end_date']}
+            for member in members[row[project_field]]:
+                if (member['id'], row['id']) not in existing:
+                    deadlines.append((member, target, target_type, content_type))
+
+        return count, deadlines
+
+    def _existing_notifications(self, content_type, targets, cutoff):
+        """
+        Return the (recipient_id, target_id) pairs that already received a
+        deadline notification for one of these targets since the cutoff.
+        """
+        return set(Notification.objects.filter(
             notification_type='deadline',
             target_content_type=content_type,
-            target_object_id=target.id,
-            timestamp__gte=timezone.now() - timedelta(hours=24)
-        ).exists()
+            target_object_id__in=targets.values('id'),
+            timestamp__gte=cutoff
+        ).values_list('recipient_id', 'target_object_id'))
+
+    def _members_by_project(self, project_ids):
+        """
+        Map each project id to its members as {'id', 'username', 'email'} dicts.
+        """
+        members = defaultdict(list)
+        rows = ProjectMember.objects.filter(project_id__in=project_ids).values(
+            'project_id', 'user_id', 'user__username', 'user__email'
+        )
+        for row in rows.iterator(chunk_size=CHUNK_SIZE):
+            members[row['project_id']].append({
+                'id': row['user_id'],
+                'username': row['user__username'],
+                'email': row['user__email'],
+            })
+        return members
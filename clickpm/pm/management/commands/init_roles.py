@@ -6,24 +6,44 @@ Management command to initialize the 4 core roles:
 - System
 """
 
+from collections import defaultdict
+
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
 from pm.models.user_models import Role
 from pm.models.access_models import RolePermission
 from pm.utils.role_permissions import ROLE_PERMISSIONS
+from pm.utils.permission_helpers import clear_role_permission_cache
 
 
 class Command(BaseCommand):
     help = 'Initialize the 4 core roles with their permissions'
 
+    @transaction.atomic
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Initializing roles...'))
         
         created_count = 0
         updated_count = 0
+
+        existing_roles = {
+            role.name: role
+            for role in Role.objects.filter(name__in=ROLE_PERMISSIONS.keys())
+        }
+
+        existing_permissions = defaultdict(set)
+        for role_id, permission_type in RolePermission.objects.filter(
+            role__in=existing_roles.values()
+        ).values_list('role_id', 'permission_type'):
+            existing_permissions[role_id].add(permission_type)
         
         for role_name, role_data in ROLE_PERMISSIONS.items():
             # Create or get role
-            role, created = Role.objects.get_or_create(name=role_name)
+            role = existing_roles.get(role_name)
+            created = role is None
+            if created:
+                role = Role.objects.create(name=role_name)
             
             if created:
                 created_count += 1
@@ -36,23 +56,37 @@ class Command(BaseCommand):
                     self.style.WARNING(f'→ Role already exists: {role_name}')
                 )
             
-            # Clear existing permissions
-            RolePermission.objects.filter(role=role).delete()
-            
-            # Add permissions
-            for permission in role_data['permissions']:
-                RolePermission.objects.create(
+            # Sync permissions: only touch rows that actually changed
+            current = existing_permissions[role.id]
+            wanted = set(role_data['permissions'])
+            to_add = wanted - current
+            to_remove = current - wanted
+
+            if to_remove:
+                RolePermission.objects.filter(
                     role=role,
-                    permission_type=permission
+                    permission_type__in=to_remove
+                ).delete()
+            
+            if to_add:
+                RolePermission.objects.bulk_create(
+                    [
+                        RolePermission(role=role, permission_type=permission)
+                        for permission in to_add
+                    ],
+                    batch_size=200
                 )
             
             self.stdout.write(
-                f'  Added {len(role_data["permissions"])} permissions'
+                f'  Added {len(to_add)} permissions, removed {len(to_remove)}'
             )
             self.stdout.write(
                 f'  Description: {role_data["description"]}'
             )
             self.stdout.write('')  # Blank line
+
+        # bulk_create sends no post_save, so the signal handlers never ran
+        clear_role_permission_cache()
         
         self.stdout.write(
             self.style.SUCCESS(
@@ -71,9 +105,15 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS('Role Summary:'))
         self.stdout.write('=' * 70)
         
-        for role_name in ROLE_PERMISSIONS.keys():
-            role = Role.objects.get(name=role_name)
-            perm_count = RolePermission.objects.filter(role=role).count()
+        roles = {
+            role.name: role
+            for role in Role.objects.filter(
+                name__in=ROLE_PERMISSIONS.keys()
+            ).annotate(perm_count=Count('permissions'))
+        }
+        
+        for role_name, role_data in ROLE_PERMISSIONS.items():
+            perm_count = roles[role_name].perm_count
             self.stdout.write(
-                f'{role_name:15} - {perm_count:2} permissions - {ROLE_PERMISSIONS[role_name]["description"]}'
+                f'{role_name:15} - {perm_count:2} permissions - {role_data["description"]}'
             )
@@ -3,9 +3,13 @@ Management command to populate the database with sample/seed data.
 Creates users, workspaces, projects, milestones, sprints, tasks, and comments.
 """
 
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from django.utils import timezone
+from collections import namedtuple
 from datetime import timedelta
+import os
 from pm.models.user_models import User, Role
 from pm.models.workspace_models import Workspace, WorkspaceMember
 from pm.models.project_models import Project, ProjectMember, Milestone, Sprint
@@ -13,6 +17,274 @@ from pm.models.task_models import Task, TaskDependency
 from pm.models.comment_models import Comment
 from pm.models.notification_models import Notification
 
+# Rows buffered per INSERT; override with the SEED_BATCH_SIZE env var
+BATCH_SIZE = 500
+
+# Tables reported by print_summary, as (label, model)
+SUMMARY_MODELS = (
+    ('Users', User),
+    ('Roles', Role),
+    ('Workspaces', Workspace),
+    ('Projects', Project),
+    ('Milestones', Milestone),
+    ('Sprints', Sprint),
+    ('Tasks', Task),
+    ('Comments', Comment),
+    ('Notifications', Notification),
+)
+SummaryCounts = namedtuple('SummaryCounts', [label.lower() for label, _ in SUMMARY_MODELS])
+
+# Seed fixtures. Dates are day offsets: projects relative to today,
+# milestones/sprints relative to their parent's start date.
+ROLE_NAMES = ('Admin', 'Project Admin', 'User', 'System')
+
+# Shared by every seed user
+SEED_PASSWORD = 'password123'
+
+USER_DATA = (
+    {'username': 'john_doe', 'email': 'john@example.com', 'first_name': 'John', 'last_name': 'Doe', 'role': 'Admin', 'gender': 'Male'},
+    {'username': 'jane_smith', 'email': 'jane@example.com', 'first_name': 'Jane', 'last_name': 'Smith', 'role': 'Project Admin', 'gender': 'Female'},
+    {'username': 'bob_wilson', 'email': 'bob@example.com', 'first_name': 'Bob', 'last_name': 'Wilson', 'role': 'User', 'gender': 'Male'},
+    {'username': 'alice_jones', 'email': 'alice@example.com', 'first_name': 'Alice', 'last_name': 'Jones', 'role': 'User', 'gender': 'Female'},
+    {'username': 'charlie_brown', 'email': 'charlie@example.com', 'first_name': 'Charlie', 'last_name': 'Brown', 'role': 'User', 'gender': 'Male'},
+    {'username': 'diana_prince', 'email': 'diana@example.com', 'first_name': 'Diana', 'last_name': 'Prince', 'role': 'Project Admin', 'gender': 'Female'},
+)
+
+WORKSPACE_DATA = (
+    {
+        'name': 'Engineering Team',
+        'description': 'Main workspace for the engineering team to collaborate on software projects.',
+        'owner': 'john_doe',
+        'members': ['jane_smith', 'bob_wilson', 'alice_jones']
+    },
+    {
+        'name': 'Marketing Team',
+        'description': 'Workspace for marketing campaigns and content management.',
+        'owner': 'diana_prince',
+        'members': ['charlie_brown', 'alice_jones']
+    },
+    {
+        'name': 'Product Development',
+        'description': 'Cross-functional workspace for product planning and development.',
+        'owner': 'jane_smith',
+        'members': ['john_doe', 'bob_wilson', 'diana_prince']
+    },
+)
+
+PROJECT_DATA = (
+    {
+        'name': 'Website Redesign',
+        'description': 'Complete overhaul of the company website with modern design and improved UX.',
+        'workspace': 'Engineering Team',
+        'status': 'active',
+        'visibility': 'public',
+        'offset': (-30, 60),
+        'members': ['john_doe', 'jane_smith', 'bob_wilson'],
+        'tags': 'web,frontend,design',
+    },
+    {
+        'name': 'Mobile App Development',
+        'description': 'Native mobile application for iOS and Android platforms.',
+        'workspace': 'Engineering Team',
+        'status': 'active',
+        'visibility': 'private',
+        'offset': (-15, 90),
+        'members': ['jane_smith', 'alice_jones'],
+        'tags': 'mobile,ios,android',
+    },
+    {
+        'name': 'Q1 Marketing Campaign',
+        'description': 'Digital marketing campaign for Q1 product launch.',
+        'workspace': 'Marketing Team',
+        'status': 'planning',
+        'visibility': 'public',
+        'offset': (0, 45),
+        'members': ['diana_prince', 'charlie_brown'],
+        'tags': 'marketing,campaign,digital',
+    },
+    {
+        'name': 'API Integration Platform',
+        'description': 'Build a centralized API integration platform for third-party services.',
+        'workspace': 'Product Development',
+        'status': 'active',
+        'visibility': 'private',
+        'offset': (-45, 30),
+        'members': ['john_doe', 'bob_wilson', 'diana_prince'],
+        'tags': 'api,backend,integration',
+    },
+    {
+        'name': 'Customer Portal',
+        'description': 'Self-service customer portal for account management.',
+        'workspace': 'Product Development',
+        'status': 'on_hold',
+        'visibility': 'private',
+        'offset': (30, 120),
+        'members': ['jane_smith', 'alice_jones'],
+        'tags': 'portal,customer,frontend',
+    },
+)
+
+MILESTONE_DATA = (
+    # Website Redesign milestones
+    {'project': 'Website Redesign', 'name': 'Design Phase', 'description': 'UI/UX design and wireframes', 'status': 'Completed', 'offset': (0, 14)},
+    {'project': 'Website Redesign', 'name': 'Frontend Development', 'description': 'Implement the new design', 'status': 'In Progress', 'offset': (14, 35)},
+    {'project': 'Website Redesign', 'name': 'Testing & Launch', 'description': 'QA testing and production deployment', 'status': 'Not Started', 'offset': (35, 60)},
+
+    # Mobile App milestones
+    {'project': 'Mobile App Development', 'name': 'MVP Features', 'description': 'Core features for initial release', 'status': 'In Progress', 'offset': (0, 30)},
+    {'project': 'Mobile App Development', 'name': 'Beta Release', 'description': 'Beta testing with select users', 'status': 'Not Started', 'offset': (30, 60)},
+    {'project': 'Mobile App Development', 'name': 'App Store Launch', 'description': 'Public release on app stores', 'status': 'Not Started', 'offset': (60, 90)},
+
+    # Marketing Campaign milestones
+    {'project': 'Q1 Marketing Campaign', 'name': 'Content Creation', 'description': 'Create all marketing assets', 'status': 'In Progress', 'offset': (0, 20)},
+    {'project': 'Q1 Marketing Campaign', 'name': 'Campaign Launch', 'description': 'Launch and monitor campaign', 'status': 'Not Started', 'offset': (20, 45)},
+
+    # API Platform milestones
+    {'project': 'API Integration Platform', 'name': 'Core API Development', 'description': 'Build core API endpoints', 'status': 'Completed', 'offset': (0, 20)},
+    {'project': 'API Integration Platform', 'name': 'Integration Layer', 'description': 'Third-party service integrations', 'status': 'In Progress', 'offset': (20, 45)},
+    {'project': 'API Integration Platform', 'name': 'Documentation & SDK', 'description': 'API docs and client SDKs', 'status': 'Not Started', 'offset': (45, 75)},
+)
+
+SPRINT_DATA = (
+    # Design Phase sprints
+    {'milestone': ('Website Redesign', 'Design Phase'), 'name': 'Sprint 1 - Research', 'description': 'User research and competitor analysis', 'status': 'Completed', 'offset': (0, 7)},
+    {'milestone': ('Website Redesign', 'Design Phase'), 'name': 'Sprint 2 - Wireframes', 'description': 'Create wireframes and mockups', 'status': 'Completed', 'offset': (7, 14)},
+
+    # Frontend Development sprints
+    {'milestone': ('Website Redesign', 'Frontend Development'), 'name': 'Sprint 3 - Homepage', 'description': 'Implement homepage design', 'status': 'In Progress', 'offset': (0, 7)},
+    {'milestone': ('Website Redesign', 'Frontend Development'), 'name': 'Sprint 4 - Inner Pages', 'description': 'Implement inner page templates', 'status': 'Not Started', 'offset': (7, 14)},
+    {'milestone': ('Website Redesign', 'Frontend Development'), 'name': 'Sprint 5 - Components', 'description': 'Reusable UI components', 'status': 'Not Started', 'offset': (14, 21)},
+
+    # MVP Features sprints
+    {'milestone': ('Mobile App Development', 'MVP Features'), 'name': 'Sprint 1 - Auth', 'description': 'User authentication flow', 'status': 'Completed', 'offset': (0, 10)},
+    {'milestone': ('Mobile App Development', 'MVP Features'), 'name': 'Sprint 2 - Dashboard', 'description': 'Main dashboard features', 'status': 'In Progress', 'offset': (10, 20)},
+    {'milestone': ('Mobile App Development', 'MVP Features'), 'name': 'Sprint 3 - Settings', 'description': 'User settings and profile', 'status': 'Not Started', 'offset': (20, 30)},
+
+    # Content Creation sprints
+    {'milestone': ('Q1 Marketing Campaign', 'Content Creation'), 'name': 'Sprint 1 - Assets', 'description': 'Create visual assets', 'status': 'In Progress', 'offset': (0, 10)},
+    {'milestone': ('Q1 Marketing Campaign', 'Content Creation'), 'name': 'Sprint 2 - Copy', 'description': 'Write marketing copy', 'status': 'Not Started', 'offset': (10, 20)},
+
+    # Core API Development sprints
+    {'milestone': ('API Integration Platform', 'Core API Development'), 'name': 'Sprint 1 - Foundation', 'description': 'API architecture setup', 'status': 'Completed', 'offset': (0, 10)},
+    {'milestone': ('API Integration Platform', 'Core API Development'), 'name': 'Sprint 2 - Endpoints', 'description': 'Core CRUD endpoints', 'status': 'Completed', 'offset': (10, 20)},
+
+    # Integration Layer sprints
+    {'milestone': ('API Integration Platform', 'Integration Layer'), 'name': 'Sprint 3 - OAuth', 'description': 'OAuth provider integrations', 'status': 'In Progress', 'offset': (0, 12)},
+    {'milestone': ('API Integration Platform', 'Integration Layer'), 'name': 'Sprint 4 - Webhooks', 'description': 'Webhook handlers', 'status': 'Not Started', 'offset': (12, 25)},
+)
+
+TASK_DATA = (
+    # Sprint 1 - Research tasks
+    {'sprint': ('Website Redesign', 'Design Phase', 'Sprint 1 - Research'), 'title': 'Conduct user interviews', 'status': 'Done', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'john_doe', 'weight': 30},
+    {'sprint': ('Website Redesign', 'Design Phase', 'Sprint 1 - Research'), 'title': 'Analyze competitor websites', 'status': 'Done', 'priority': 'Medium', 'assignee': 'bob_wilson', 'reporter': 'john_doe', 'weight': 25},
+    {'sprint': ('Website Redesign', 'Design Phase', 'Sprint 1 - Research'), 'title': 'Create user personas', 'status': 'Done', 'priority': 'Medium', 'assignee': 'jane_smith', 'reporter': 'john_doe', 'weight': 25},
+    {'sprint': ('Website Redesign', 'Design Phase', 'Sprint 1 - Research'), 'title': 'Document findings', 'status': 'Done', 'priority': 'Low', 'assignee': 'bob_wilson', 'reporter': 'jane_smith', 'weight': 20},
+
+    # Sprint 2 - Wireframes tasks
+    {'sprint': ('Website Redesign', 'Design Phase', 'Sprint 2 - Wireframes'), 'title': 'Create homepage wireframe', 'status': 'Done', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'john_doe', 'weight': 30},
+    {'sprint': ('Website Redesign', 'Design Phase', 'Sprint 2 - Wireframes'), 'title': 'Design navigation structure', 'status': 'Done', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'john_doe', 'weight': 25},
+    {'sprint': ('Website Redesign', 'Design Phase', 'Sprint 2 - Wireframes'), 'title': 'Create mobile wireframes', 'status': 'Done', 'priority': 'Medium', 'assignee': 'bob_wilson', 'reporter': 'jane_smith', 'weight': 25},
+    {'sprint': ('Website Redesign', 'Design Phase', 'Sprint 2 - Wireframes'), 'title': 'Get stakeholder approval', 'status': 'Done', 'priority': 'Critical', 'assignee': 'john_doe', 'reporter': 'jane_smith', 'weight': 20},
+
+    # Sprint 3 - Homepage tasks
+    {'sprint': ('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'title': 'Set up project structure', 'status': 'Done', 'priority': 'High', 'assignee': 'bob_wilson', 'reporter': 'jane_smith', 'weight': 15},
+    {'sprint': ('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'title': 'Implement hero section', 'status': 'Done', 'priority': 'High', 'assignee': 'bob_wilson', 'reporter': 'jane_smith', 'weight': 25},
+    {'sprint': ('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'title': 'Build features section', 'status': 'In Progress', 'priority': 'Medium', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 25},
+    {'sprint': ('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'title': 'Add footer component', 'status': 'To-do', 'priority': 'Medium', 'assignee': 'bob_wilson', 'reporter': 'jane_smith', 'weight': 15},
+    {'sprint': ('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'title': 'Implement responsive design', 'status': 'To-do', 'priority': 'High', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 20},
+
+    # Mobile App - Sprint 1 Auth tasks
+    {'sprint': ('Mobile App Development', 'MVP Features', 'Sprint 1 - Auth'), 'title': 'Design login screen', 'status': 'Done', 'priority': 'High', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 25},
+    {'sprint': ('Mobile App Development', 'MVP Features', 'Sprint 1 - Auth'), 'title': 'Implement JWT authentication', 'status': 'Done', 'priority': 'Critical', 'assignee': 'jane_smith', 'reporter': 'jane_smith', 'weight': 35},
+    {'sprint': ('Mobile App Development', 'MVP Features', 'Sprint 1 - Auth'), 'title': 'Add biometric login', 'status': 'Done', 'priority': 'Medium', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 25},
+    {'sprint': ('Mobile App Development', 'MVP Features', 'Sprint 1 - Auth'), 'title': 'Test auth flow', 'status': 'Done', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'jane_smith', 'weight': 15},
+
+    # Mobile App - Sprint 2 Dashboard tasks
+    {'sprint': ('Mobile App Development', 'MVP Features', 'Sprint 2 - Dashboard'), 'title': 'Create dashboard layout', 'status': 'Done', 'priority': 'High', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 25},
+    {'sprint': ('Mobile App Development', 'MVP Features', 'Sprint 2 - Dashboard'), 'title': 'Implement data widgets', 'status': 'In Progress', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'jane_smith', 'weight': 30},
+    {'sprint': ('Mobile App Development', 'MVP Features', 'Sprint 2 - Dashboard'), 'title': 'Add pull-to-refresh', 'status': 'To-do', 'priority': 'Medium', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 20},
+    {'sprint': ('Mobile App Development', 'MVP Features', 'Sprint 2 - Dashboard'), 'title': 'Implement navigation', 'status': 'Review', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'jane_smith', 'weight': 25},
+
+    # Marketing - Sprint 1 Assets tasks
+    {'sprint': ('Q1 Marketing Campaign', 'Content Creation', 'Sprint 1 - Assets'), 'title': 'Design social media graphics', 'status': 'Done', 'priority': 'High', 'assignee': 'charlie_brown', 'reporter': 'diana_prince', 'weight': 30},
+    {'sprint': ('Q1 Marketing Campaign', 'Content Creation', 'Sprint 1 - Assets'), 'title': 'Create video thumbnails', 'status': 'In Progress', 'priority': 'Medium', 'assignee': 'charlie_brown', 'reporter': 'diana_prince', 'weight': 25},
+    {'sprint': ('Q1 Marketing Campaign', 'Content Creation', 'Sprint 1 - Assets'), 'title': 'Design email templates', 'status': 'To-do', 'priority': 'High', 'assignee': 'diana_prince', 'reporter': 'diana_prince', 'weight': 25},
+    {'sprint': ('Q1 Marketing Campaign', 'Content Creation', 'Sprint 1 - Assets'), 'title': 'Create banner ads', 'status': 'To-do', 'priority': 'Medium', 'assignee': 'charlie_brown', 'reporter': 'diana_prince', 'weight': 20},
+
+    # API Platform - Sprint 1 Foundation tasks
+    {'sprint': ('API Integration Platform', 'Core API Development', 'Sprint 1 - Foundation'), 'title': 'Set up API project', 'status': 'Done', 'priority': 'Critical', 'assignee': 'john_doe', 'reporter': 'jane_smith', 'weight': 25},
+    {'sprint': ('API Integration Platform', 'Core API Development', 'Sprint 1 - Foundation'), 'title': 'Configure authentication', 'status': 'Done', 'priority': 'Critical', 'assignee': 'bob_wilson', 'reporter': 'john_doe', 'weight': 30},
+    {'sprint': ('API Integration Platform', 'Core API Development', 'Sprint 1 - Foundation'), 'title': 'Set up database schema', 'status': 'Done', 'priority': 'High', 'assignee': 'john_doe', 'reporter': 'jane_smith', 'weight': 25},
+    {'sprint': ('API Integration Platform', 'Core API Development', 'Sprint 1 - Foundation'), 'title': 'Configure CI/CD pipeline', 'status': 'Done', 'priority': 'Medium', 'assignee': 'diana_prince', 'reporter': 'john_doe', 'weight': 20},
+
+    # API Platform - Sprint 3 OAuth tasks
+    {'sprint': ('API Integration Platform', 'Integration Layer', 'Sprint 3 - OAuth'), 'title': 'Implement Google OAuth', 'status': 'Done', 'priority': 'High', 'assignee': 'bob_wilson', 'reporter': 'john_doe', 'weight': 30},
+    {'sprint': ('API Integration Platform', 'Integration Layer', 'Sprint 3 - OAuth'), 'title': 'Add GitHub OAuth', 'status': 'In Progress', 'priority': 'High', 'assignee': 'john_doe', 'reporter': 'john_doe', 'weight': 30},
+    {'sprint': ('API Integration Platform', 'Integration Layer', 'Sprint 3 - OAuth'), 'title': 'Implement Microsoft OAuth', 'status': 'To-do', 'priority': 'Medium', 'assignee': 'bob_wilson', 'reporter': 'john_doe', 'weight': 25},
+    {'sprint': ('API Integration Platform', 'Integration Layer', 'Sprint 3 - OAuth'), 'title': 'Write OAuth documentation', 'status': 'To-do', 'priority': 'Low', 'assignee': 'diana_prince', 'reporter': 'john_doe', 'weight': 15},
+)
+
+# (task, depends_on, type); tasks are (sprint key, title) as in TASK_DATA
+TASK_DEPENDENCIES = (
+    ((('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Implement hero section'), (('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Set up project structure'), 'Blocked By'),
+    ((('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Build features section'), (('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Implement hero section'), 'Blocked By'),
+    ((('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Add footer component'), (('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Set up project structure'), 'Blocked By'),
+    ((('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Implement responsive design'), (('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Build features section'), 'Blocked By'),
+    ((('Mobile App Development', 'MVP Features', 'Sprint 1 - Auth'), 'Implement JWT authentication'), (('Mobile App Development', 'MVP Features', 'Sprint 1 - Auth'), 'Design login screen'), 'Blocked By'),
+    ((('Mobile App Development', 'MVP Features', 'Sprint 1 - Auth'), 'Add biometric login'), (('Mobile App Development', 'MVP Features', 'Sprint 1 - Auth'), 'Implement JWT authentication'), 'Blocked By'),
+    ((('Mobile App Development', 'MVP Features', 'Sprint 2 - Dashboard'), 'Implement data widgets'), (('Mobile App Development', 'MVP Features', 'Sprint 2 - Dashboard'), 'Create dashboard layout'), 'Blocked By'),
+    ((('API Integration Platform', 'Integration Layer', 'Sprint 3 - OAuth'), 'Add GitHub OAuth'), (('API Integration Platform', 'Integration Layer', 'Sprint 3 - OAuth'), 'Implement Google OAuth'), 'Related To'),
+    ((('API Integration Platform', 'Integration Layer', 'Sprint 3 - OAuth'), 'Implement Microsoft OAuth'), (('API Integration Platform', 'Integration Layer', 'Sprint 3 - OAuth'), 'Implement Google OAuth'), 'Related To'),
+)
+
+# (task, author, content); tasks are (sprint key, title) as in TASK_DATA
+COMMENT_DATA = (
+    ((('Website Redesign', 'Design Phase', 'Sprint 1 - Research'), 'Conduct user interviews'), 'john_doe', 'Great work on the interviews! The insights are very valuable.'),
+    ((('Website Redesign', 'Design Phase', 'Sprint 1 - Research'), 'Conduct user interviews'), 'jane_smith', 'Thank you! I learned a lot from the user feedback.'),
+    ((('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Implement hero section'), 'jane_smith', 'Looking good! Can we add some animation effects?'),
+    ((('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Implement hero section'), 'bob_wilson', 'Sure, I will add some subtle animations.'),
+    ((('Website Redesign', 'Frontend Development', 'Sprint 3 - Homepage'), 'Build features section'), 'john_doe', 'Make sure to follow the design specs closely.'),
+    ((('Mobile App Development', 'MVP Features', 'Sprint 1 - Auth'), 'Implement JWT authentication'), 'jane_smith', 'Added refresh token support as discussed.'),
+    ((('Q1 Marketing Campaign', 'Content Creation', 'Sprint 1 - Assets'), 'Design social media graphics'), 'diana_prince', 'The color scheme looks perfect!'),
+    ((('API Integration Platform', 'Integration Layer', 'Sprint 3 - OAuth'), 'Implement Google OAuth'), 'john_doe', 'Tested on staging, works great!'),
+    ((('API Integration Platform', 'Integration Layer', 'Sprint 3 - OAuth'), 'Add GitHub OAuth'), 'bob_wilson', 'Almost done, just need to handle edge cases.'),
+)
+
+NOTIFICATION_DATA = (
+    ('john_doe', 'jane_smith', 'assigned you to a new task', 'assignment'),
+    ('jane_smith', 'bob_wilson', 'commented on your task', 'comment'),
+    ('bob_wilson', 'john_doe', 'completed task "Set up project structure"', 'general'),
+    ('alice_jones', 'jane_smith', 'Task deadline approaching in 2 days', 'deadline'),
+    ('charlie_brown', 'diana_prince', 'updated the marketing campaign status', 'general'),
+    ('diana_prince', 'john_doe', 'mentioned you in a comment', 'mention'),
+)
+
+# timedelta for every day offset used by the fixtures, built once
+DAY_OFFSETS = {
+    days: timedelta(days=days)
+    for data in PROJECT_DATA + MILESTONE_DATA + SPRINT_DATA
+    for days in data['offset']
+}
+
+
+class _Batch:
+    """Buffer unsaved instances and hand them to `write` in fixed-size chunks"""
+
+    def __init__(self, write, size):
+        self.write = write
+        self.size = size
+        self.buffer = []
+
+    def add(self, obj):
+        self.buffer.append(obj)
+        if len(self.buffer) >= self.size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.write(self.buffer)
+            self.buffer = []
+
 
 class Command(BaseCommand):
     help = 'Populate the database with sample seed data'
@@ -23,543 +295,468 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing data before seeding (except superusers)',
         )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Update existing seed users and memberships from the fixtures (upsert)',
+        )
+        parser.add_argument(
+            '--fast',
+            action='store_true',
+            help='On PostgreSQL, do not wait for WAL flushes on commit while seeding',
+        )
 
     def handle(self, *args, **options):
+        self.verbosity = options['verbosity']
+        self.today = timezone.now().date()
+        self.batch_size = int(os.environ.get('SEED_BATCH_SIZE', BATCH_SIZE))
+        self.refresh = options['refresh']
+        self.fast = options['fast']
         self.stdout.write(self.style.SUCCESS('Starting seed data creation...'))
 
+        if self.refresh and not connection.features.supports_update_conflicts_with_target:
+            self.stdout.write(self.style.WARNING(
+                'This database does not support upserts; --refresh is ignored.'
+            ))
+            self.refresh = False
+
+        self._set_commit_mode()
+
         if options['clear']:
             self.clear_data()
 
-        # Create roles first
-        roles = self.create_roles()
+        # One transaction for every table so the inserts share a single commit
+        with transaction.atomic():
+            # Create roles first
+            roles = self.create_roles()
 
-        # Create users
-        users = self.create_users(roles)
+            # Create users
+            user_pks = self.create_users(roles)
 
-        # Create workspaces
-        workspaces = self.create_workspaces(users, roles)
+            # Create workspaces
+            workspaces = self.create_workspaces(user_pks, roles)
 
-        # Create projects
-        projects = self.create_projects(workspaces, users, roles)
+            # Create projects
+            projects = self.create_projects(workspaces, user_pks, roles)
 
-        # Create milestones
-        milestones = self.create_milestones(projects)
+            # Create milestones
+            milestones = self.create_milestones(projects)
 
-        # Create sprints
-        sprints = self.create_sprints(milestones)
+            # Create sprints
+            sprints = self.create_sprints(milestones)
 
-        # Create tasks
-        tasks = self.create_tasks(sprints, users)
+            # Create tasks
+            task_pks = self.create_tasks(sprints, user_pks)
 
-        # Create task dependencies
-        self.create_task_dependencies(tasks)
+            # Create task dependencies
+            self.create_task_dependencies(task_pks)
 
-        # Create comments
-        self.create_comments(tasks, users)
+            # Create comments
+            self.create_comments(task_pks, user_pks)
 
-        # Create notifications
-        self.create_notifications(users, tasks)
+            # Create notifications
+            self.create_notifications(user_pks)
 
         self.stdout.write(self.style.SUCCESS('\n[OK] Seed data creation complete!'))
         self.print_summary()
 
+    def _set_commit_mode(self):
+        """
+        With --fast on PostgreSQL, turn off synchronous_commit for this
+        connection. Commits return before the WAL reaches disk; a crash can
+        lose the last commits but never corrupts data, which is fine for
+        seed data.
+        """
+        if self.fast and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET synchronous_commit TO OFF')
+
+    @transaction.atomic
     def clear_data(self):
         """Clear existing data except superusers"""
         self.stdout.write(self.style.WARNING('Clearing existing data...'))
-        Notification.objects.all().delete()
-        Comment.objects.all().delete()
-        TaskDependency.objects.all().delete()
-        Task.objects.all().delete()
-        Sprint.objects.all().delete()
-        Milestone.objects.all().delete()
-        ProjectMember.objects.all().delete()
-        Project.objects.all().delete()
-        WorkspaceMember.objects.all().delete()
-        Workspace.objects.all().delete()
+        models = [
+            Notification, Comment, TaskDependency, Task, Sprint, Milestone,
+            ProjectMember, Project, WorkspaceMember, Workspace,
+        ]
+        if connection.vendor == 'postgresql':
+            # One TRUNCATE skips the ORM collector and per-row deletes
+            tables = ', '.join(connection.ops.quote_name(model._meta.db_table) for model in models)
+            with connection.cursor() as cursor:
+                cursor.execute(f'TRUNCATE TABLE {tables} RESTART IDENTITY CASCADE')
+        else:
+            for model in models:
+                model.objects.all().delete()
+        # Users go through the ORM so SET_NULL references (activity logs etc.) are handled
         User.objects.filter(is_superuser=False).delete()
         self.stdout.write(self.style.SUCCESS('Data cleared.'))
 
     def create_roles(self):
         """Create or get roles"""
         self.stdout.write('Creating roles...')
-        roles = {}
-        role_names = ['Admin', 'Project Admin', 'User', 'System']
-        for name in role_names:
-            role, created = Role.objects.get_or_create(name=name)
-            roles[name] = role
-            status = 'Created' if created else 'Exists'
-            self.stdout.write(f'  {status}: {name}')
+        instances, created_flags = self._bulk_get_or_create(
+            Role, ('name',), [Role(name=name) for name in ROLE_NAMES]
+        )
+        roles = {role.name: role for role in instances}
+        self._report(ROLE_NAMES, created_flags)
         return roles
 
     def create_users(self, roles):
         """Create sample users"""
         self.stdout.write('Creating users...')
-        users = {}
-
-        user_data = [
-            {'username': 'john_doe', 'email': 'john@example.com', 'first_name': 'John', 'last_name': 'Doe', 'role': 'Admin', 'gender': 'Male'},
-            {'username': 'jane_smith', 'email': 'jane@example.com', 'first_name': 'Jane', 'last_name': 'Smith', 'role': 'Project Admin', 'gender': 'Female'},
-            {'username': 'bob_wilson', 'email': 'bob@example.com', 'first_name': 'Bob', 'last_name': 'Wilson', 'role': 'User', 'gender': 'Male'},
-            {'username': 'alice_jones', 'email': 'alice@example.com', 'first_name': 'Alice', 'last_name': 'Jones', 'role': 'User', 'gender': 'Female'},
-            {'username': 'charlie_brown', 'email': 'charlie@example.com', 'first_name': 'Charlie', 'last_name': 'Brown', 'role': 'User', 'gender': 'Male'},
-            {'username': 'diana_prince', 'email': 'diana@example.com', 'first_name': 'Diana', 'last_name': 'Prince', 'role': 'Project Admin', 'gender': 'Female'},
-        ]
 
-        for data in user_data:
-            user, created = User.objects.get_or_create(
-                username=data['username'],
-                defaults={
-                    'email': data['email'],
-                    'first_name': data['first_name'],
-                    'last_name': data['last_name'],
-                    'role': roles.get(data['role']),
-                    'gender': data['gender'],
-                }
-            )
-            if created:
-                user.set_password('password123')
-                user.save()
-            users[data['username']] = user
-            status = 'Created' if created else 'Exists'
-            self.stdout.write(f'  {status}: {data["username"]} ({data["role"]})')
+        usernames = [data['username'] for data in USER_DATA]
+        # Later steps only need the pk to set foreign keys
+        queryset = User.objects.filter(username__in=usernames).values_list('username', 'id')
+        user_pks = dict(queryset)
+        existing = set(user_pks)
+
+        if self.refresh or len(existing) < len(usernames):
+            # Every seed user shares one password, so hash it once
+            hashed_password = make_password(SEED_PASSWORD)
+            role_pk = {name: role.pk for name, role in roles.items()}
+            self._insert(User, (
+                User(
+                    username=data['username'],
+                    email=data['email'],
+                    first_name=data['first_name'],
+                    last_name=data['last_name'],
+                    role_id=role_pk.get(data['role']),
+                    gender=data['gender'],
+                    password=hashed_password,
+                )
+                for data in USER_DATA
+                if self.refresh or data['username'] not in existing
+            ), unique_fields=['username'], update_fields=['email', 'first_name', 'last_name', 'role', 'gender'])
+            user_pks.update(queryset.exclude(username__in=existing))
+
+        self._report(
+            [f'{data["username"]} ({data["role"]})' for data in USER_DATA],
+            [data['username'] not in existing for data in USER_DATA],
+        )
 
-        return users
+        return user_pks
 
-    def create_workspaces(self, users, roles):
+    def create_workspaces(self, user_pks, roles):
         """Create sample workspaces"""
         self.stdout.write('Creating workspaces...')
-        workspaces = {}
-
-        workspace_data = [
-            {
-                'name': 'Engineering Team',
-                'description': 'Main workspace for the engineering team to collaborate on software projects.',
-                'owner': 'john_doe',
-                'members': ['jane_smith', 'bob_wilson', 'alice_jones']
-            },
-            {
-                'name': 'Marketing Team',
-                'description': 'Workspace for marketing campaigns and content management.',
-                'owner': 'diana_prince',
-                'members': ['charlie_brown', 'alice_jones']
-            },
-            {
-                'name': 'Product Development',
-                'description': 'Cross-functional workspace for product planning and development.',
-                'owner': 'jane_smith',
-                'members': ['john_doe', 'bob_wilson', 'diana_prince']
-            },
-        ]
 
-        for data in workspace_data:
-            workspace, created = Workspace.objects.get_or_create(
+        instances, created_flags = self._bulk_get_or_create(Workspace, ('name',), [
+            Workspace(
                 name=data['name'],
-                defaults={
-                    'description': data['description'],
-                    'owner': users[data['owner']],
-                }
+                description=data['description'],
+                owner_id=user_pks[data['owner']],
             )
-            workspaces[data['name']] = workspace
-
-            # Add members
-            for member_username in data['members']:
-                WorkspaceMember.objects.get_or_create(
-                    workspace=workspace,
-                    user=users[member_username],
-                    defaults={'role': roles['User']}
-                )
-
-            status = 'Created' if created else 'Exists'
-            self.stdout.write(f'  {status}: {data["name"]}')
+            for data in WORKSPACE_DATA
+        ])
+
+        workspaces = {workspace.name: workspace for workspace in instances}
+        self._report([data['name'] for data in WORKSPACE_DATA], created_flags)
+
+        # Add members; unique_together makes existing memberships a no-op
+        self._insert(WorkspaceMember, (
+            WorkspaceMember(
+                workspace_id=workspaces[data['name']].pk,
+                user_id=user_pks[member_username],
+                role_id=roles['User'].pk,
+            )
+            for data in WORKSPACE_DATA
+            for member_username in data['members']
+        ), unique_fields=['workspace', 'user'], update_fields=['role'])
 
         return workspaces
 
-    def create_projects(self, workspaces, users, roles):
+    def create_projects(self, workspaces, user_pks, roles):
         """Create sample projects"""
         self.stdout.write('Creating projects...')
-        projects = {}
-        today = timezone.now().date()
-
-        project_data = [
-            {
-                'name': 'Website Redesign',
-                'description': 'Complete overhaul of the company website with modern design and improved UX.',
-                'workspace': 'Engineering Team',
-                'status': 'active',
-                'visibility': 'public',
-                'start_date': today - timedelta(days=30),
-                'end_date': today + timedelta(days=60),
-                'members': ['john_doe', 'jane_smith', 'bob_wilson'],
-                'tags': 'web,frontend,design',
-            },
-            {
-                'name': 'Mobile App Development',
-                'description': 'Native mobile application for iOS and Android platforms.',
-                'workspace': 'Engineering Team',
-                'status': 'active',
-                'visibility': 'private',
-                'start_date': today - timedelta(days=15),
-                'end_date': today + timedelta(days=90),
-                'members': ['jane_smith', 'alice_jones'],
-                'tags': 'mobile,ios,android',
-            },
-            {
-                'name': 'Q1 Marketing Campaign',
-                'description': 'Digital marketing campaign for Q1 product launch.',
-                'workspace': 'Marketing Team',
-                'status': 'planning',
-                'visibility': 'public',
-                'start_date': today,
-                'end_date': today + timedelta(days=45),
-                'members': ['diana_prince', 'charlie_brown'],
-                'tags': 'marketing,campaign,digital',
-            },
-            {
-                'name': 'API Integration Platform',
-                'description': 'Build a centralized API integration platform for third-party services.',
-                'workspace': 'Product Development',
-                'status': 'active',
-                'visibility': 'private',
-                'start_date': today - timedelta(days=45),
-                'end_date': today + timedelta(days=30),
-                'members': ['john_doe', 'bob_wilson', 'diana_prince'],
-                'tags': 'api,backend,integration',
-            },
-            {
-                'name': 'Customer Portal',
-                'description': 'Self-service customer portal for account management.',
-                'workspace': 'Product Development',
-                'status': 'on_hold',
-                'visibility': 'private',
-                'start_date': today + timedelta(days=30),
-                'end_date': today + timedelta(days=120),
-                'members': ['jane_smith', 'alice_jones'],
-                'tags': 'portal,customer,frontend',
-            },
-        ]
+        today = self.today
 
-        for data in project_data:
-            project, created = Project.objects.get_or_create(
+        instances, created_flags = self._bulk_get_or_create(Project, ('name', 'workspace_id'), [
+            Project(
                 name=data['name'],
-                workspace=workspaces[data['workspace']],
-                defaults={
-                    'description': data['description'],
-                    'status': data['status'],
-                    'visibility': data['visibility'],
-                    'start_date': data['start_date'],
-                    'end_date': data['end_date'],
-                    'tags': data['tags'],
-                }
+                workspace_id=workspaces[data['workspace']].pk,
+                description=data['description'],
+                status=data['status'],
+                visibility=data['visibility'],
+                start_date=today + DAY_OFFSETS[data['offset'][0]],
+                end_date=today + DAY_OFFSETS[data['offset'][1]],
+                tags=data['tags'],
             )
-            projects[data['name']] = project
-
-            # Add project members
-            for i, member_username in enumerate(data['members']):
-                role = roles['Project Admin'] if i == 0 else roles['User']
-                ProjectMember.objects.get_or_create(
-                    project=project,
-                    user=users[member_username],
-                    defaults={'role': role}
-                )
-
-            status = 'Created' if created else 'Exists'
-            self.stdout.write(f'  {status}: {data["name"]}')
+            for data in PROJECT_DATA
+        ], fields=('start_date',))
+
+        projects = {project.name: project for project in instances}
+        self._report([data['name'] for data in PROJECT_DATA], created_flags)
+
+        # Add project members; the first listed member is the project admin
+        self._insert(ProjectMember, (
+            ProjectMember(
+                project_id=projects[data['name']].pk,
+                user_id=user_pks[member_username],
+                role_id=(roles['Project Admin'] if i == 0 else roles['User']).pk,
+            )
+            for data in PROJECT_DATA
+            for i, member_username in enumerate(data['members'])
+        ), unique_fields=['user', 'project'], update_fields=['role'])
 
         return projects
 
     def create_milestones(self, projects):
         """Create sample milestones"""
         self.stdout.write('Creating milestones...')
-        milestones = {}
-
-        milestone_data = [
-            # Website Redesign milestones
-            {'project': 'Website Redesign', 'name': 'Design Phase', 'description': 'UI/UX design and wireframes', 'status': 'Completed', 'offset': (0, 14)},
-            {'project': 'Website Redesign', 'name': 'Frontend Development', 'description': 'Implement the new design', 'status': 'In Progress', 'offset': (14, 35)},
-            {'project': 'Website Redesign', 'name': 'Testing & Launch', 'description': 'QA testing and production deployment', 'status': 'Not Started', 'offset': (35, 60)},
-
-            # Mobile App milestones
-            {'project': 'Mobile App Development', 'name': 'MVP Features', 'description': 'Core features for initial release', 'status': 'In Progress', 'offset': (0, 30)},
-            {'project': 'Mobile App Development', 'name': 'Beta Release', 'description': 'Beta testing with select users', 'status': 'Not Started', 'offset': (30, 60)},
-            {'project': 'Mobile App Development', 'name': 'App Store Launch', 'description': 'Public release on app stores', 'status': 'Not Started', 'offset': (60, 90)},
-
-            # Marketing Campaign milestones
-            {'project': 'Q1 Marketing Campaign', 'name': 'Content Creation', 'description': 'Create all marketing assets', 'status': 'In Progress', 'offset': (0, 20)},
-            {'project': 'Q1 Marketing Campaign', 'name': 'Campaign Launch', 'description': 'Launch and monitor campaign', 'status': 'Not Started', 'offset': (20, 45)},
-
-            # API Platform milestones
-            {'project': 'API Integration Platform', 'name': 'Core API Development', 'description': 'Build core API endpoints', 'status': 'Completed', 'offset': (0, 20)},
-            {'project': 'API Integration Platform', 'name': 'Integration Layer', 'description': 'Third-party service integrations', 'status': 'In Progress', 'offset': (20, 45)},
-            {'project': 'API Integration Platform', 'name': 'Documentation & SDK', 'description': 'API docs and client SDKs', 'status': 'Not Started', 'offset': (45, 75)},
-        ]
 
-        for data in milestone_data:
+        new_milestones = []
+        for data in MILESTONE_DATA:
             project = projects[data['project']]
             start_offset, end_offset = data['offset']
-
-            milestone, created = Milestone.objects.get_or_create(
-                project=project,
+            new_milestones.append(Milestone(
+                project_id=project.pk,
                 name=data['name'],
-                defaults={
-                    'description': data['description'],
-                    'status': data['status'],
-                    'start_date': project.start_date + timedelta(days=start_offset),
-                    'end_date': project.start_date + timedelta(days=end_offset),
-                }
-            )
-            key = f"{data['project']}:{data['name']}"
-            milestones[key] = milestone
+                description=data['description'],
+                status=data['status'],
+                start_date=project.start_date + DAY_OFFSETS[start_offset],
+                end_date=project.start_date + DAY_OFFSETS[end_offset],
+            ))
+        instances, created_flags = self._bulk_get_or_create(
+            Milestone, ('project_id', 'name'), new_milestones, fields=('start_date',)
+        )
 
-            status = 'Created' if created else 'Exists'
-            self.stdout.write(f'  {status}: {data["name"]} ({data["project"]})')
+        milestones = {
+            (data['project'], data['name']): milestone
+            for data, milestone in zip(MILESTONE_DATA, instances)
+        }
+        self._report(
+            [f'{data["name"]} ({data["project"]})' for data in MILESTONE_DATA], created_flags
+        )
 
         return milestones
 
     def create_sprints(self, milestones):
         """Create sample sprints"""
         self.stdout.write('Creating sprints...')
-        sprints = {}
-
-        sprint_data = [
-            # Design Phase sprints
-            {'milestone': 'Website Redesign:Design Phase', 'name': 'Sprint 1 - Research', 'description': 'User research and competitor analysis', 'status': 'Completed', 'offset': (0, 7)},
-            {'milestone': 'Website Redesign:Design Phase', 'name': 'Sprint 2 - Wireframes', 'description': 'Create wireframes and mockups', 'status': 'Completed', 'offset': (7, 14)},
-
-            # Frontend Development sprints
-            {'milestone': 'Website Redesign:Frontend Development', 'name': 'Sprint 3 - Homepage', 'description': 'Implement homepage design', 'status': 'In Progress', 'offset': (0, 7)},
-            {'milestone': 'Website Redesign:Frontend Development', 'name': 'Sprint 4 - Inner Pages', 'description': 'Implement inner page templates', 'status': 'Not Started', 'offset': (7, 14)},
-            {'milestone': 'Website Redesign:Frontend Development', 'name': 'Sprint 5 - Components', 'description': 'Reusable UI components', 'status': 'Not Started', 'offset': (14, 21)},
-
-            # MVP Features sprints
-            {'milestone': 'Mobile App Development:MVP Features', 'name': 'Sprint 1 - Auth', 'description': 'User authentication flow', 'status': 'Completed', 'offset': (0, 10)},
-            {'milestone': 'Mobile App Development:MVP Features', 'name': 'Sprint 2 - Dashboard', 'description': 'Main dashboard features', 'status': 'In Progress', 'offset': (10, 20)},
-            {'milestone': 'Mobile App Development:MVP Features', 'name': 'Sprint 3 - Settings', 'description': 'User settings and profile', 'status': 'Not Started', 'offset': (20, 30)},
-
-            # Content Creation sprints
-            {'milestone': 'Q1 Marketing Campaign:Content Creation', 'name': 'Sprint 1 - Assets', 'description': 'Create visual assets', 'status': 'In Progress', 'offset': (0, 10)},
-            {'milestone': 'Q1 Marketing Campaign:Content Creation', 'name': 'Sprint 2 - Copy', 'description': 'Write marketing copy', 'status': 'Not Started', 'offset': (10, 20)},
-
-            # Core API Development sprints
-            {'milestone': 'API Integration Platform:Core API Development', 'name': 'Sprint 1 - Foundation', 'description': 'API architecture setup', 'status': 'Completed', 'offset': (0, 10)},
-            {'milestone': 'API Integration Platform:Core API Development', 'name': 'Sprint 2 - Endpoints', 'description': 'Core CRUD endpoints', 'status': 'Completed', 'offset': (10, 20)},
-
-            # Integration Layer sprints
-            {'milestone': 'API Integration Platform:Integration Layer', 'name': 'Sprint 3 - OAuth', 'description': 'OAuth provider integrations', 'status': 'In Progress', 'offset': (0, 12)},
-            {'milestone': 'API Integration Platform:Integration Layer', 'name': 'Sprint 4 - Webhooks', 'description': 'Webhook handlers', 'status': 'Not Started', 'offset': (12, 25)},
-        ]
 
-        for data in sprint_data:
+        new_sprints = []
+        for data in SPRINT_DATA:
             milestone = milestones[data['milestone']]
             start_offset, end_offset = data['offset']
-
-            sprint, created = Sprint.objects.get_or_create(
-                milestone=milestone,
+            new_sprints.append(Sprint(
+                milestone_id=milestone.pk,
                 name=data['name'],
-                defaults={
-                    'description': data['description'],
-                    'status': data['status'],
-                    'start_date': milestone.start_date + timedelta(days=start_offset),
-                    'end_date': milestone.start_date + timedelta(days=end_offset),
-                }
-            )
-            key = f"{data['milestone']}:{data['name']}"
-            sprints[key] = sprint
+                description=data['description'],
+                status=data['status'],
+                start_date=milestone.start_date + DAY_OFFSETS[start_offset],
+                end_date=milestone.start_date + DAY_OFFSETS[end_offset],
+            ))
+        instances, created_flags = self._bulk_get_or_create(
+            Sprint, ('milestone_id', 'name'), new_sprints, fields=('start_date', 'end_date')
+        )
 
-            status = 'Created' if created else 'Exists'
-            self.stdout.write(f'  {status}: {data["name"]}')
+        sprints = {
+            (*data['milestone'], data['name']): sprint
+            for data, sprint in zip(SPRINT_DATA, instances)
+        }
+        self._report([data['name'] for data in SPRINT_DATA], created_flags)
 
         return sprints
 
-    def create_tasks(self, sprints, users):
+    def create_tasks(self, sprints, user_pks):
         """Create sample tasks"""
         self.stdout.write('Creating tasks...')
-        tasks = {}
-
-        task_data = [
-            # Sprint 1 - Research tasks
-            {'sprint': 'Website Redesign:Design Phase:Sprint 1 - Research', 'title': 'Conduct user interviews', 'status': 'Done', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'john_doe', 'weight': 30},
-            {'sprint': 'Website Redesign:Design Phase:Sprint 1 - Research', 'title': 'Analyze competitor websites', 'status': 'Done', 'priority': 'Medium', 'assignee': 'bob_wilson', 'reporter': 'john_doe', 'weight': 25},
-            {'sprint': 'Website Redesign:Design Phase:Sprint 1 - Research', 'title': 'Create user personas', 'status': 'Done', 'priority': 'Medium', 'assignee': 'jane_smith', 'reporter': 'john_doe', 'weight': 25},
-            {'sprint': 'Website Redesign:Design Phase:Sprint 1 - Research', 'title': 'Document findings', 'status': 'Done', 'priority': 'Low', 'assignee': 'bob_wilson', 'reporter': 'jane_smith', 'weight': 20},
-
-            # Sprint 2 - Wireframes tasks
-            {'sprint': 'Website Redesign:Design Phase:Sprint 2 - Wireframes', 'title': 'Create homepage wireframe', 'status': 'Done', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'john_doe', 'weight': 30},
-            {'sprint': 'Website Redesign:Design Phase:Sprint 2 - Wireframes', 'title': 'Design navigation structure', 'status': 'Done', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'john_doe', 'weight': 25},
-            {'sprint': 'Website Redesign:Design Phase:Sprint 2 - Wireframes', 'title': 'Create mobile wireframes', 'status': 'Done', 'priority': 'Medium', 'assignee': 'bob_wilson', 'reporter': 'jane_smith', 'weight': 25},
-            {'sprint': 'Website Redesign:Design Phase:Sprint 2 - Wireframes', 'title': 'Get stakeholder approval', 'status': 'Done', 'priority': 'Critical', 'assignee': 'john_doe', 'reporter': 'jane_smith', 'weight': 20},
-
-            # Sprint 3 - Homepage tasks
-            {'sprint': 'Website Redesign:Frontend Development:Sprint 3 - Homepage', 'title': 'Set up project structure', 'status': 'Done', 'priority': 'High', 'assignee': 'bob_wilson', 'reporter': 'jane_smith', 'weight': 15},
-            {'sprint': 'Website Redesign:Frontend Development:Sprint 3 - Homepage', 'title': 'Implement hero section', 'status': 'Done', 'priority': 'High', 'assignee': 'bob_wilson', 'reporter': 'jane_smith', 'weight': 25},
-            {'sprint': 'Website Redesign:Frontend Development:Sprint 3 - Homepage', 'title': 'Build features section', 'status': 'In Progress', 'priority': 'Medium', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 25},
-            {'sprint': 'Website Redesign:Frontend Development:Sprint 3 - Homepage', 'title': 'Add footer component', 'status': 'To-do', 'priority': 'Medium', 'assignee': 'bob_wilson', 'reporter': 'jane_smith', 'weight': 15},
-            {'sprint': 'Website Redesign:Frontend Development:Sprint 3 - Homepage', 'title': 'Implement responsive design', 'status': 'To-do', 'priority': 'High', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 20},
-
-            # Mobile App - Sprint 1 Auth tasks
-            {'sprint': 'Mobile App Development:MVP Features:Sprint 1 - Auth', 'title': 'Design login screen', 'status': 'Done', 'priority': 'High', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 25},
-            {'sprint': 'Mobile App Development:MVP Features:Sprint 1 - Auth', 'title': 'Implement JWT authentication', 'status': 'Done', 'priority': 'Critical', 'assignee': 'jane_smith', 'reporter': 'jane_smith', 'weight': 35},
-            {'sprint': 'Mobile App Development:MVP Features:Sprint 1 - Auth', 'title': 'Add biometric login', 'status': 'Done', 'priority': 'Medium', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 25},
-            {'sprint': 'Mobile App Development:MVP Features:Sprint 1 - Auth', 'title': 'Test auth flow', 'status': 'Done', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'jane_smith', 'weight': 15},
-
-            # Mobile App - Sprint 2 Dashboard tasks
-            {'sprint': 'Mobile App Development:MVP Features:Sprint 2 - Dashboard', 'title': 'Create dashboard layout', 'status': 'Done', 'priority': 'High', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 25},
-            {'sprint': 'Mobile App Development:MVP Features:Sprint 2 - Dashboard', 'title': 'Implement data widgets', 'status': 'In Progress', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'jane_smith', 'weight': 30},
-            {'sprint': 'Mobile App Development:MVP Features:Sprint 2 - Dashboard', 'title': 'Add pull-to-refresh', 'status': 'To-do', 'priority': 'Medium', 'assignee': 'alice_jones', 'reporter': 'jane_smith', 'weight': 20},
-            {'sprint': 'Mobile App Development:MVP Features:Sprint 2 - Dashboard', 'title': 'Implement navigation', 'status': 'Review', 'priority': 'High', 'assignee': 'jane_smith', 'reporter': 'jane_smith', 'weight': 25},
-
-            # Marketing - Sprint 1 Assets tasks
-            {'sprint': 'Q1 Marketing Campaign:Content Creation:Sprint 1 - Assets', 'title': 'Design social media graphics', 'status': 'Done', 'priority': 'High', 'assignee': 'charlie_brown', 'reporter': 'diana_prince', 'weight': 30},
-            {'sprint': 'Q1 Marketing Campaign:Content Creation:Sprint 1 - Assets', 'title': 'Create video thumbnails', 'status': 'In Progress', 'priority': 'Medium', 'assignee': 'charlie_brown', 'reporter': 'diana_prince', 'weight': 25},
-            {'sprint': 'Q1 Marketing Campaign:Content Creation:Sprint 1 - Assets', 'title': 'Design email templates', 'status': 'To-do', 'priority': 'High', 'assignee': 'diana_prince', 'reporter': 'diana_prince', 'weight': 25},
-            {'sprint': 'Q1 Marketing Campaign:Content Creation:Sprint 1 - Assets', 'title': 'Create banner ads', 'status': 'To-do', 'priority': 'Medium', 'assignee': 'charlie_brown', 'reporter': 'diana_prince', 'weight': 20},
-
-            # API Platform - Sprint 1 Foundation tasks
-            {'sprint': 'API Integration Platform:Core API Development:Sprint 1 - Foundation', 'title': 'Set up API project', 'status': 'Done', 'priority': 'Critical', 'assignee': 'john_doe', 'reporter': 'jane_smith', 'weight': 25},
-            {'sprint': 'API Integration Platform:Core API Development:Sprint 1 - Foundation', 'title': 'Configure authentication', 'status': 'Done', 'priority': 'Critical', 'assignee': 'bob_wilson', 'reporter': 'john_doe', 'weight': 30},
-            {'sprint': 'API Integration Platform:Core API Development:Sprint 1 - Foundation', 'title': 'Set up database schema', 'status': 'Done', 'priority': 'High', 'assignee': 'john_doe', 'reporter': 'jane_smith', 'weight': 25},
-            {'sprint': 'API Integration Platform:Core API Development:Sprint 1 - Foundation', 'title': 'Configure CI/CD pipeline', 'status': 'Done', 'priority': 'Medium', 'assignee': 'diana_prince', 'reporter': 'john_doe', 'weight': 20},
-
-            # API Platform - Sprint 3 OAuth tasks
-            {'sprint': 'API Integration Platform:Integration Layer:Sprint 3 - OAuth', 'title': 'Implement Google OAuth', 'status': 'Done', 'priority': 'High', 'assignee': 'bob_wilson', 'reporter': 'john_doe', 'weight': 30},
-            {'sprint': 'API Integration Platform:Integration Layer:Sprint 3 - OAuth', 'title': 'Add GitHub OAuth', 'status': 'In Progress', 'priority': 'High', 'assignee': 'john_doe', 'reporter': 'john_doe', 'weight': 30},
-            {'sprint': 'API Integration Platform:Integration Layer:Sprint 3 - OAuth', 'title': 'Implement Microsoft OAuth', 'status': 'To-do', 'priority': 'Medium', 'assignee': 'bob_wilson', 'reporter': 'john_doe', 'weight': 25},
-            {'sprint': 'API Integration Platform:Integration Layer:Sprint 3 - OAuth', 'title': 'Write OAuth documentation', 'status': 'To-do', 'priority': 'Low', 'assignee': 'diana_prince', 'reporter': 'john_doe', 'weight': 15},
-        ]
 
-        for data in task_data:
+        new_tasks = []
+        for data in TASK_DATA:
             sprint = sprints[data['sprint']]
-
-            task, created = Task.objects.get_or_create(
-                sprint=sprint,
+            new_tasks.append(Task(
+                sprint_id=sprint.pk,
                 title=data['title'],
-                defaults={
-                    'description': f"Task: {data['title']}",
-                    'status': data['status'],
-                    'priority': data['priority'],
-                    'assignee': users.get(data['assignee']),
-                    'reporter': users.get(data['reporter']),
-                    'start_date': sprint.start_date,
-                    'due_date': sprint.end_date,
-                }
-            )
-            tasks[data['title']] = task
+                description=f"Task: {data['title']}",
+                status=data['status'],
+                priority=data['priority'],
+                assignee_id=user_pks.get(data['assignee']),
+                reporter_id=user_pks.get(data['reporter']),
+                start_date=sprint.start_date,
+                due_date=sprint.end_date,
+            ))
+        # bulk_create skips Task.save(), so Done tasks do not run
+        # auto-completion: sprint and milestone statuses stay as in the fixtures
+        instances, created_flags = self._bulk_get_or_create(
+            Task, ('sprint_id', 'title'), new_tasks
+        )
 
-            if created:
-                self.stdout.write(f'  Created: {data["title"][:40]}...')
+        self._report([f'{data["title"][:40]}...' for data in TASK_DATA], created_flags)
+        self.stdout.write(f'  Total tasks: {len(instances)}')
 
-        self.stdout.write(f'  Total tasks: {len(tasks)}')
-        return tasks
+        # Dependencies and comments only need the task ids, keyed by
+        # (sprint key, title) since titles only have to be unique per sprint
+        return {
+            (data['sprint'], data['title']): task.pk
+            for data, task in zip(TASK_DATA, instances)
+        }
 
-    def create_task_dependencies(self, tasks):
+    def create_task_dependencies(self, task_pks):
         """Create sample task dependencies"""
         self.stdout.write('Creating task dependencies...')
 
-        dependencies = [
-            ('Implement hero section', 'Set up project structure', 'Blocked By'),
-            ('Build features section', 'Implement hero section', 'Blocked By'),
-            ('Add footer component', 'Set up project structure', 'Blocked By'),
-            ('Implement responsive design', 'Build features section', 'Blocked By'),
-            ('Implement JWT authentication', 'Design login screen', 'Blocked By'),
-            ('Add biometric login', 'Implement JWT authentication', 'Blocked By'),
-            ('Implement data widgets', 'Create dashboard layout', 'Blocked By'),
-            ('Add GitHub OAuth', 'Implement Google OAuth', 'Related To'),
-            ('Implement Microsoft OAuth', 'Implement Google OAuth', 'Related To'),
+        rows = [
+            (task_pks[task_key], task_pks[depends_on_key], dep_type)
+            for task_key, depends_on_key, dep_type in TASK_DEPENDENCIES
+            if task_key in task_pks and depends_on_key in task_pks
         ]
+        existing = set(
+            TaskDependency.objects.filter(task_id__in={task_id for task_id, _, _ in rows})
+            .values_list('task_id', 'depends_on_id')
+        )
+        # unique_together (task, depends_on) keeps existing rows and their type
+        self._insert(TaskDependency, (
+            TaskDependency(task_id=task_id, depends_on_id=depends_on_id, type=dep_type)
+            for task_id, depends_on_id, dep_type in rows
+            if (task_id, depends_on_id) not in existing
+        ))
+
+        self._report(
+            [f'{task_id} {dep_type} {depends_on_id}' for task_id, depends_on_id, dep_type in rows],
+            [(task_id, depends_on_id) not in existing for task_id, depends_on_id, _ in rows],
+        )
 
-        count = 0
-        for task_title, depends_on_title, dep_type in dependencies:
-            task = tasks.get(task_title)
-            depends_on = tasks.get(depends_on_title)
-
-            if task and depends_on:
-                _, created = TaskDependency.objects.get_or_create(
-                    task=task,
-                    depends_on=depends_on,
-                    defaults={'type': dep_type}
-                )
-                if created:
-                    count += 1
-
-        self.stdout.write(f'  Created {count} dependencies')
-
-    def create_comments(self, tasks, users):
+    def create_comments(self, task_pks, user_pks):
         """Create sample comments on tasks"""
         self.stdout.write('Creating comments...')
 
-        comment_data = [
-            ('Conduct user interviews', 'john_doe', 'Great work on the interviews! The insights are very valuable.'),
-            ('Conduct user interviews', 'jane_smith', 'Thank you! I learned a lot from the user feedback.'),
-            ('Implement hero section', 'jane_smith', 'Looking good! Can we add some animation effects?'),
-            ('Implement hero section', 'bob_wilson', 'Sure, I will add some subtle animations.'),
-            ('Build features section', 'john_doe', 'Make sure to follow the design specs closely.'),
-            ('Implement JWT authentication', 'jane_smith', 'Added refresh token support as discussed.'),
-            ('Design social media graphics', 'diana_prince', 'The color scheme looks perfect!'),
-            ('Implement Google OAuth', 'john_doe', 'Tested on staging, works great!'),
-            ('Add GitHub OAuth', 'bob_wilson', 'Almost done, just need to handle edge cases.'),
+        rows = [
+            (task_pks[task_key], user_pks[username], content)
+            for task_key, username, content in COMMENT_DATA
+            if task_key in task_pks and username in user_pks
         ]
+        # Comments have no unique key, so skip rows that were already seeded
+        existing = set(
+            Comment.objects.filter(task_id__in={task_id for task_id, _, _ in rows})
+            .values_list('task_id', 'author_id', 'content')
+        )
+        self._insert(Comment, (
+            Comment(task_id=task_id, author_id=author_id, content=content)
+            for task_id, author_id, content in rows
+            if (task_id, author_id, content) not in existing
+        ))
+
+        self._report(
+            [f'{content[:40]}...' for _, _, content in rows],
+            [row not in existing for row in rows],
+        )
 
-        count = 0
-        for task_title, username, content in comment_data:
-            task = tasks.get(task_title)
-            user = users.get(username)
-
-            if task and user:
-                Comment.objects.get_or_create(
-                    task=task,
-                    author=user,
-                    content=content,
-                )
-                count += 1
-
-        self.stdout.write(f'  Created {count} comments')
-
-    def create_notifications(self, users, tasks):
+    def create_notifications(self, user_pks):
         """Create sample notifications"""
         self.stdout.write('Creating notifications...')
 
-        notification_data = [
-            ('john_doe', 'jane_smith', 'assigned you to a new task', 'assignment'),
-            ('jane_smith', 'bob_wilson', 'commented on your task', 'comment'),
-            ('bob_wilson', 'john_doe', 'completed task "Set up project structure"', 'general'),
-            ('alice_jones', 'jane_smith', 'Task deadline approaching in 2 days', 'deadline'),
-            ('charlie_brown', 'diana_prince', 'updated the marketing campaign status', 'general'),
-            ('diana_prince', 'john_doe', 'mentioned you in a comment', 'mention'),
+        rows = [
+            (user_pks[recipient_name], user_pks[actor_name], verb, notification_type)
+            for recipient_name, actor_name, verb, notification_type in NOTIFICATION_DATA
+            if recipient_name in user_pks and actor_name in user_pks
         ]
+        existing = set(
+            Notification.objects.filter(verb__in={verb for _, _, verb, _ in rows})
+            .values_list('recipient_id', 'actor_id', 'verb')
+        )
+        self._insert(Notification, (
+            Notification(
+                recipient_id=recipient_id,
+                actor_id=actor_id,
+                verb=verb,
+                notification_type=notification_type,
+                read=False,
+            )
+            for recipient_id, actor_id, verb, notification_type in rows
+            if (recipient_id, actor_id, verb) not in existing
+        ))
 
-        count = 0
-        for recipient_name, actor_name, verb, notification_type in notification_data:
-            recipient = users.get(recipient_name)
-            actor = users.get(actor_name)
-
-            if recipient and actor:
-                Notification.objects.get_or_create(
-                    recipient=recipient,
-                    actor=actor,
-                    verb=verb,
-                    defaults={
-                        'notification_type': notification_type,
-                        'read': False,
-                    }
-                )
-                count += 1
+        self._report(
+            [verb for _, _, verb, _ in rows],
+            [(recipient_id, actor_id, verb) not in existing for recipient_id, actor_id, verb, _ in rows],
+        )
 
-        self.stdout.write(f'  Created {count} notifications')
+    def _report(self, labels, created_flags):
+        """
+        Write one summary line per table; per-row status lines only at
+        --verbosity 2 or higher.
+        """
+        if self.verbosity > 1:
+            for label, created in zip(labels, created_flags):
+                status = 'Created' if created else 'Exists'
+                self.stdout.write(f'  {status}: {label}')
+        created_count = sum(created_flags)
+        self.stdout.write(f'  Created {created_count}, existing {len(created_flags) - created_count}')
+
+    def _bulk_get_or_create(self, model, key_fields, objs, fields=()):
+        """
+        Load the rows matching the objs' key_fields values, insert the objs
+        that are missing and load just those back. Only the pk, the key
+        fields and any extra `fields` later steps read are loaded. A re-run
+        where every row exists costs a single SELECT.
+
+        Returns (instances, created_flags), both aligned with objs.
+        """
+        keys = [tuple(getattr(obj, field) for field in key_fields) for obj in objs]
+        lookup = {
+            f'{field}__in': {key[i] for key in keys}
+            for i, field in enumerate(key_fields)
+        }
+        queryset = model.objects.filter(**lookup).only(*key_fields, *fields)
+
+        saved = {tuple(getattr(obj, field) for field in key_fields): obj for obj in queryset}
+        # The __in lookups can match extra combinations; only count our keys
+        existing = set(keys).intersection(saved)
+
+        if len(existing) < len(set(keys)):
+            self._insert(model, (obj for obj, key in zip(objs, keys) if key not in existing))
+            saved.update(
+                (tuple(getattr(obj, field) for field in key_fields), obj)
+                for obj in queryset.exclude(pk__in=[obj.pk for obj in saved.values()])
+            )
+        return [saved[key] for key in keys], [key not in existing for key in keys]
+
+    def _insert(self, model, objs, unique_fields=None, update_fields=None):
+        """
+        Insert an iterable of unsaved objs in batches of self.batch_size with
+        bulk_create. Only one batch is held in memory at a time, and pks are
+        not set on objs.
+
+        With --refresh, models that pass unique_fields/update_fields are
+        upserted (INSERT ... ON CONFLICT DO UPDATE) instead of skipping
+        rows that already exist.
+        """
+        if self.refresh and update_fields:
+            batch = _Batch(
+                lambda objs: model.objects.bulk_create(
+                    objs, update_conflicts=True,
+                    unique_fields=unique_fields, update_fields=update_fields,
+                ),
+                self.batch_size,
+            )
+        else:
+            batch = _Batch(
+                lambda objs: model.objects.bulk_create(objs, ignore_conflicts=True),
+                self.batch_size,
+            )
+        for obj in objs:
+            batch.add(obj)
+        batch.flush()
 
     def print_summary(self):
         """Print summary of created data"""
         self.stdout.write('\n' + '=' * 50)
         self.stdout.write(self.style.SUCCESS('Database Summary:'))
         self.stdout.write('=' * 50)
-        self.stdout.write(f'  Users: {User.objects.count()}')
-        self.stdout.write(f'  Roles: {Role.objects.count()}')
-        self.stdout.write(f'  Workspaces: {Workspace.objects.count()}')
-        self.stdout.write(f'  Projects: {Project.objects.count()}')
-        self.stdout.write(f'  Milestones: {Milestone.objects.count()}')
-        self.stdout.write(f'  Sprints: {Sprint.objects.count()}')
-        self.stdout.write(f'  Tasks: {Task.objects.count()}')
-        self.stdout.write(f'  Comments: {Comment.objects.count()}')
-        self.stdout.write(f'  Notifications: {Notification.objects.count()}')
+        counts = self._count_tables()
+        for (label, _), count in zip(SUMMARY_MODELS, counts):
+            self.stdout.write(f'  {label}: {count}')
         self.stdout.write('=' * 50)
         self.stdout.write('\nTest credentials for seeded users:')
-        self.stdout.write('  Password: password123')
-        self.stdout.write('  Users: john_doe, jane_smith, bob_wilson, alice_jones, charlie_brown, diana_prince')
+        self.stdout.write(f'  Password: {SEED_PASSWORD}')
+        self.stdout.write(f'  Users: {", ".join(data["username"] for data in USER_DATA)}')
+
+    def _count_tables(self):
+        """Count every SUMMARY_MODELS table in a single round trip"""
+        tables = [connection.ops.quote_name(model._meta.db_table) for _, model in SUMMARY_MODELS]
+        sql = 'SELECT ' + ', '.join(f'(SELECT COUNT(*) FROM {table})' for table in tables)
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            return SummaryCounts(*cursor.fetchone())
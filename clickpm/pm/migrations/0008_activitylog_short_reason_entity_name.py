@@ -0,0 +1,57 @@
+# Generated by Django 4.2 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+# Frozen copies of pm.models.activity_models helpers as of this migration
+ENTITY_NAME_KEYS = ('task_title', 'sprint_name', 'milestone_name', 'project_name', 'workspace_name')
+SHORT_REASON_LENGTH = 50
+BATCH_SIZE = 500
+
+
+def get_short_reason(reason):
+    if not reason:
+        return None
+    return reason[:SHORT_REASON_LENGTH] + '...' if len(reason) > SHORT_REASON_LENGTH else reason
+
+
+def get_entity_name(extra_info):
+    if extra_info:
+        for key in ENTITY_NAME_KEYS:
+            if key in extra_info:
+                return str(extra_info[key])[:255]
+    return ''
+
+
+def populate_list_columns(apps, schema_editor):
+    ActivityLog = apps.get_model('pm', 'ActivityLog')
+    logs = []
+    for log in ActivityLog.objects.only('id', 'reason', 'extra_info').iterator(chunk_size=BATCH_SIZE):
+        log.short_reason = get_short_reason(log.reason)
+        log.entity_name = get_entity_name(log.extra_info)
+        logs.append(log)
+        if len(logs) == BATCH_SIZE:
+            ActivityLog.objects.bulk_update(logs, ['short_reason', 'entity_name'])
+            logs = []
+    if logs:
+        ActivityLog.objects.bulk_update(logs, ['short_reason', 'entity_name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0007_remove_weight_percentage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activitylog',
+            name='entity_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='activitylog',
+            name='short_reason',
+            field=models.CharField(blank=True, editable=False, max_length=53, null=True),
+        ),
+        migrations.RunPython(populate_list_columns, migrations.RunPython.noop),
+    ]
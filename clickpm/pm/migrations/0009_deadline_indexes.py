@@ -0,0 +1,37 @@
+# Generated by Django 4.2 on 2026-10-16 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0008_activitylog_short_reason_entity_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='milestone',
+            index=models.Index(fields=['end_date', 'status'], name='pm_mileston_end_dat_0aa87d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['target_content_type', 'target_object_id', 'notification_type', 'timestamp'], name='pm_notifica_target__915353_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'notification_type', '-timestamp'], name='pm_notifica_recipie_baf355_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['end_date', 'status'], name='pm_project_end_dat_f00a0c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sprint',
+            index=models.Index(fields=['end_date', 'status'], name='pm_sprint_end_dat_90d6e0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['due_date', 'status'], name='pm_task_due_dat_132725_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0009_deadline_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activitylog',
+            name='entity_name',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=255),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-16 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0010_alter_activitylog_entity_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'read', 'timestamp'], name='pm_notifica_recipie_a64059_idx'),
+        ),
+    ]
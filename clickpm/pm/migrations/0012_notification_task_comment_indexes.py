@@ -0,0 +1,25 @@
+# Generated by Django 4.2 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0011_notification_recipient_read_timestamp_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('read', False)), fields=['recipient', '-timestamp'], name='notification_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['sprint', 'status'], name='pm_task_sprint__bf1e2b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['task', '-created_at'], name='pm_comment_task_id_a42c66_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-16 13:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0012_notification_task_comment_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='comment',
+            options={},
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-16 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0013_alter_comment_options'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['content_type', 'object_id', '-timestamp'], name='pm_activity_content_706717_idx'),
+        ),
+    ]
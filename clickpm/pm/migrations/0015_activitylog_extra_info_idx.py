@@ -0,0 +1,22 @@
+# Generated by Django 4.2 on 2026-10-16 14:30
+
+from django.db import migrations, models
+import django.db.models.fields.json
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0014_activitylog_entity_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(django.db.models.fields.json.KeyTransform('workspace_id', 'extra_info'), models.OrderBy(models.F('timestamp'), descending=True), name='pm_activitylog_workspace_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(django.db.models.fields.json.KeyTransform('project_id', 'extra_info'), models.OrderBy(models.F('timestamp'), descending=True), name='pm_activitylog_project_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-16 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0015_activitylog_extra_info_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['user', '-timestamp'], name='pm_activity_user_id_aae852_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['-timestamp'], name='pm_activity_timesta_530d40_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-16 15:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0017_activitylog_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='pm_notifica_recipie_a64059_idx',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-16 15:45
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0018_remove_notification_recipient_read_timestamp_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='pm_notifica_recipie_baf355_idx',
+        ),
+    ]
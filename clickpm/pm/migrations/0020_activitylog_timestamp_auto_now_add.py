@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-16 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pm', '0019_remove_notification_recipient_type_timestamp_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activitylog',
+            name='timestamp',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from pm.utils.helpers import intern_choices
 from .user_models import User, Role
 from .workspace_models import WorkspaceMember
 from .project_models import Project
@@ -58,3 +59,8 @@ class RolePermission(models.Model):
         
     def __str__(self):
         return f"{self.role.name} - {self.permission_type}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        values = intern_choices(field_names, values, ('permission_type',))
+        return super().from_db(db, field_names, values)
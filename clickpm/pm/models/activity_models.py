@@ -1,17 +1,78 @@
 from django.db import models
+from django.db.models import F
+from django.db.models.fields.json import KeyTransform
 from .user_models import User
 from django.contrib.contenttypes.models import ContentType
 
+# extra_info keys holding the entity's display name, most specific first
+ENTITY_NAME_KEYS = ('task_title', 'sprint_name', 'milestone_name', 'project_name', 'workspace_name')
+
+SHORT_REASON_LENGTH = 50
+
+
+def get_short_reason(reason):
+    """Truncate a reason for list views"""
+    if not reason:
+        return None
+    return reason[:SHORT_REASON_LENGTH] + '...' if len(reason) > SHORT_REASON_LENGTH else reason
+
+
+def get_entity_name(extra_info):
+    """Get the most specific entity name stored in extra_info"""
+    if extra_info:
+        for key in ENTITY_NAME_KEYS:
+            if key in extra_info:
+                return str(extra_info[key])[:255]
+    return ''
+
+
+class ActivityLogManager(models.Manager):
+    """Joins the acting user shown with every log entry"""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+
+
 class ActivityLog(models.Model):
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     action = models.CharField(max_length=255)  # create/update/delete
     content_type = models.CharField(max_length=100)  # model name
     object_id = models.PositiveIntegerField()
     reason = models.TextField(null=True, blank=True)  # why the change
+    short_reason = models.CharField(max_length=SHORT_REASON_LENGTH + 3, null=True, blank=True, editable=False)
     old_value = models.JSONField(null=True, blank=True)  # previous state
     new_value = models.JSONField(null=True, blank=True)  # updated state
     extra_info = models.JSONField(null=True, blank=True)  # workspace/project info
+    entity_name = models.CharField(max_length=255, blank=True, default='', editable=False, db_index=True)
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    objects = ActivityLogManager()
+
+    class Meta:
+        indexes = [
+            # History of one entity, newest first (get_entity_audit_logs)
+            models.Index(fields=['content_type', 'object_id', '-timestamp']),
+            # One user's actions, newest first (get_user_audit_logs, my_activities)
+            models.Index(fields=['user', '-timestamp']),
+            # Recent activity across everything
+            models.Index(fields=['-timestamp']),
+            # extra_info__workspace_id / __project_id filters, newest first
+            # (get_workspace_audit_logs, get_project_audit_logs)
+            models.Index(
+                KeyTransform('workspace_id', 'extra_info'), F('timestamp').desc(),
+                name='pm_activitylog_workspace_idx',
+            ),
+            models.Index(
+                KeyTransform('project_id', 'extra_info'), F('timestamp').desc(),
+                name='pm_activitylog_project_idx',
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user} - {self.action} {self.content_type}({self.object_id}) at {self.timestamp}"
+
+    def save(self, *args, **kwargs):
+        """Denormalize the list-view columns so they are computed once on write"""
+        self.short_reason = get_short_reason(self.reason)
+        self.entity_name = get_entity_name(self.extra_info)
+        super().save(*args, **kwargs)
@@ -4,6 +4,13 @@ from .comment_models import Comment
 from .task_models import Task
 
 
+class AttachmentManager(models.Manager):
+    """Joins the uploader shown with every attachment"""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('uploaded_by')
+
+
 class Attachment(models.Model):
     file = models.FileField(upload_to='attachments/')
     filename = models.CharField(max_length=255, blank=True)
@@ -31,12 +38,15 @@ class Attachment(models.Model):
         blank=True
     )
 
+    objects = AttachmentManager()
+
     def __str__(self):
         return self.filename or self.file.name
 
     def save(self, *args, **kwargs):
         if self.file and not self.filename:
             self.filename = self.file.name
-        if self.file and not self.file_size:
-            self.file_size = self.file.size
+        if self.file and not self.file._committed:
+            # Fresh upload: its size is known in memory, so never stat the storage
+            self.file_size = self.file.file.size
         super().save(*args, **kwargs)
@@ -3,6 +3,14 @@ from .user_models import User
 from .task_models import Task
 from .project_models import Project, Sprint
 
+
+class CommentManager(models.Manager):
+    """Joins the author and the commented resource shown with every comment"""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('author', 'task', 'sprint', 'project')
+
+
 class Comment(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE)
     content = models.TextField()
@@ -14,9 +22,16 @@ class Comment(models.Model):
     sprint = models.ForeignKey(Sprint, on_delete=models.CASCADE, null=True, blank=True, related_name='comments')
     project = models.ForeignKey(Project, on_delete=models.CASCADE, null=True, blank=True, related_name='comments')
 
+    objects = CommentManager()
+
     class Meta:
-        ordering = ['-created_at']
+        # No default ordering: list endpoints order explicitly, and internal
+        # queries (counts, cascades, seeding) skip the sort
+        indexes = [
+            models.Index(fields=['task', '-created_at']),
+        ]
 
     def __str__(self):
-        resource = "Task" if self.task else ("Sprint" if self.sprint else ("Project" if self.project else "Unknown"))
+        # Test the FK ids: the resource type does not need the related rows
+        resource = "Task" if self.task_id else ("Sprint" if self.sprint_id else ("Project" if self.project_id else "Unknown"))
         return f"Comment by {self.author.username} on {resource}"
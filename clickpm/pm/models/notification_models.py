@@ -1,9 +1,17 @@
 from django.db import models
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from pm.utils.helpers import intern_choices
 from .user_models import User
 
 
+class NotificationManager(models.Manager):
+    """Joins the relations every notification listing renders"""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('recipient', 'actor', 'target_content_type')
+
+
 class Notification(models.Model):
     """
     Notification model for user alerts.
@@ -53,16 +61,31 @@ class Notification(models.Model):
     
     read = models.BooleanField(default=False)
     timestamp = models.DateTimeField(auto_now_add=True)
+
+    objects = NotificationManager()
     
     class Meta:
         ordering = ['-timestamp']
         indexes = [
             models.Index(fields=['recipient', '-timestamp']),
             models.Index(fields=['read']),
+            # "My unread notifications", newest first
+            models.Index(
+                fields=['recipient', '-timestamp'],
+                condition=models.Q(read=False),
+                name='notification_unread_idx',
+            ),
+            # Deadline de-duplication in check_deadlines
+            models.Index(fields=['target_content_type', 'target_object_id', 'notification_type', 'timestamp']),
         ]
     
     def __str__(self):
         return f"{self.recipient.username} - {self.verb}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        values = intern_choices(field_names, values, ('notification_type',))
+        return super().from_db(db, field_names, values)
     
     def mark_as_read(self):
         """Mark this notification as read"""
@@ -1,8 +1,39 @@
+from collections import defaultdict
+
 from django.db import models
+from django.db.models import Count, Q
 from django.core.validators import MinValueValidator, MaxValueValidator
 from .user_models import User, Role
 from .workspace_models import Workspace
 
+
+def _milestone_completions(milestones):
+    """
+    Average the sprint completions of each milestone in `milestones`, a
+    Milestone queryset. The task counting is done by the database in one
+    grouped query (one row per milestone/sprint pair, sprintless milestones
+    included). Returns {milestone_id: (project_id, percentage)}.
+    """
+    sprint_completions = defaultdict(list)
+    project_ids = {}
+    rows = milestones.order_by().values('id', 'project_id', 'sprints__id').annotate(
+        total=Count('sprints__tasks'),
+        done=Count('sprints__tasks', filter=Q(sprints__tasks__status='Done')),
+    )
+    for row in rows:
+        project_ids[row['id']] = row['project_id']
+        if row['sprints__id'] is not None:
+            sprint_completions[row['id']].append(
+                (row['done'] / row['total'] * 100) if row['total'] > 0 else 0.0
+            )
+
+    completions = {}
+    for milestone_id, project_id in project_ids.items():
+        # Simple average (equal weights for all sprints)
+        sprints = sprint_completions[milestone_id]
+        completions[milestone_id] = (project_id, sum(sprints) / len(sprints) if sprints else 0.0)
+    return completions
+
 # Project model
 class Project(models.Model):
     name = models.CharField(max_length=200)
@@ -27,16 +58,32 @@ class Project(models.Model):
         Formula: PC = Σ(MC_i) / number_of_milestones
         (Equal weighting - weights are calculated automatically)
         """
-        milestones = self.milestones.all()
-        if not milestones.exists():
-            return 0.0
-        
-        # Simple average (equal weights for all milestones)
-        milestone_completions = [m.calculate_completion_percentage() for m in milestones]
-        return sum(milestone_completions) / len(milestone_completions)
+        return Project.completion_percentages([self.pk])[self.pk]
+
+    @classmethod
+    def completion_percentages(cls, project_ids):
+        """
+        Completion for many projects at once, in a single query.
+        Returns {project_id: percentage}; projects without milestones get 0.0.
+        """
+        milestone_completions = defaultdict(list)
+        for project_id, completion in _milestone_completions(
+            Milestone.objects.filter(project_id__in=project_ids)
+        ).values():
+            milestone_completions[project_id].append(completion)
+
+        percentages = {}
+        for project_id in project_ids:
+            # Simple average (equal weights for all milestones)
+            completions = milestone_completions[project_id]
+            percentages[project_id] = sum(completions) / len(completions) if completions else 0.0
+        return percentages
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['end_date', 'status']),
+        ]
 
 
 # Project membership
@@ -73,16 +120,26 @@ class Milestone(models.Model):
         Formula: MC_i = Σ(SC_ij) / number_of_sprints
         (Equal weighting - weights are calculated automatically)
         """
-        sprints = self.sprints.all()
-        if not sprints.exists():
-            return 0.0
-        
-        # Simple average (equal weights for all sprints)
-        sprint_completions = [s.calculate_completion_percentage() for s in sprints]
-        return sum(sprint_completions) / len(sprint_completions)
+        return Milestone.completion_percentages([self.pk])[self.pk]
+
+    @classmethod
+    def completion_percentages(cls, milestone_ids):
+        """
+        Completion for many milestones at once, in a single query over their
+        sprints' task counts. Returns {milestone_id: percentage}; milestones
+        without sprints get 0.0.
+        """
+        completions = _milestone_completions(Milestone.objects.filter(id__in=milestone_ids))
+        return {
+            milestone_id: completions[milestone_id][1] if milestone_id in completions else 0.0
+            for milestone_id in milestone_ids
+        }
 
     class Meta:
         ordering = ['start_date']
+        indexes = [
+            models.Index(fields=['end_date', 'status']),
+        ]
 
 
 # Sprint - belongs to Milestone (comments allowed)
@@ -104,14 +161,32 @@ class Sprint(models.Model):
         Calculate sprint completion based on weighted task contributions.
         Simple count-based calculation: percentage of Done tasks.
         """
-        tasks = self.tasks.all()
-        if not tasks.exists():
-            return 0.0
-
-        total_tasks = tasks.count()
-        done_tasks = tasks.filter(status='Done').count()
-        return (done_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
+        counts = self.tasks.aggregate(
+            total=Count('id'),
+            done=Count('id', filter=Q(status='Done')),
+        )
+        total_tasks = counts['total']
+        return (counts['done'] / total_tasks * 100) if total_tasks > 0 else 0.0
+
+    @classmethod
+    def completion_percentages(cls, sprint_ids):
+        """
+        Completion for many sprints at once, in a single grouped query.
+        Returns {sprint_id: percentage}; sprints without tasks get 0.0.
+        """
+        rows = Sprint.objects.filter(id__in=sprint_ids).order_by().values('id').annotate(
+            total=Count('tasks'),
+            done=Count('tasks', filter=Q(tasks__status='Done')),
+        )
+        percentages = dict.fromkeys(sprint_ids, 0.0)
+        for row in rows:
+            if row['total'] > 0:
+                percentages[row['id']] = row['done'] / row['total'] * 100
+        return percentages
 
     class Meta:
         ordering = ['start_date']
+        indexes = [
+            models.Index(fields=['end_date', 'status']),
+        ]
 
@@ -1,4 +1,5 @@
 from django.db import models
+from pm.utils.helpers import intern_choices
 from .user_models import User
 from .project_models import Sprint
 
@@ -43,23 +44,42 @@ class Task(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['due_date', 'status']),
+            models.Index(fields=['sprint', 'status']),
+        ]
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        values = intern_choices(field_names, values, ('status', 'priority'))
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so save() can spot transitions without a query
+        if 'status' in field_names:
+            instance._loaded_status = instance.status
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        # A partial refresh leaves status as it was, including unsaved edits
+        if fields is None or 'status' in fields:
+            self._loaded_status = self.status
+
     def save(self, *args, **kwargs):
         """
         Save task and trigger auto-completion if status is set to Done
         """
         old_status = None
         if self.pk:
-            try:
-                old_task = Task.objects.get(pk=self.pk)
-                old_status = old_task.status
-            except Task.DoesNotExist:
-                pass
+            if hasattr(self, '_loaded_status'):
+                old_status = self._loaded_status
+            else:
+                old_status = Task.objects.filter(pk=self.pk).values_list('status', flat=True).first()
 
         super().save(*args, **kwargs)
+        self._loaded_status = self.status
 
         if old_status != 'Done' and self.status == 'Done':
             from pm.services.auto_completion import auto_complete_on_task_done
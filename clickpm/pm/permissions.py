@@ -8,6 +8,21 @@ from .utils.permission_helpers import (
     has_role_permission
 )
 
+
+def _member_workspace_ids(request):
+    """
+    Ids of the workspaces request.user belongs to. Loaded once and kept on
+    the request, so checking every object of a list costs a single query.
+    """
+    workspace_ids = getattr(request, '_workspace_memberships', None)
+    if workspace_ids is None:
+        workspace_ids = set(
+            WorkspaceMember.objects.filter(user=request.user).values_list('workspace_id', flat=True)
+        )
+        request._workspace_memberships = workspace_ids
+    return workspace_ids
+
+
 class IsWorkspaceMember(BasePermission):
     """
     Permission check to see if user is a member of the workspace.
@@ -31,7 +46,7 @@ class IsWorkspaceMember(BasePermission):
         if not workspace:
             return False
             
-        return WorkspaceMember.objects.filter(workspace=workspace, user=request.user).exists()
+        return workspace.pk in _member_workspace_ids(request)
 
 
 class IsWorkspaceAdmin(BasePermission):
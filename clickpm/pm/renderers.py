@@ -0,0 +1,26 @@
+import orjson
+from rest_framework.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson. Types orjson does not know
+    (Decimal, lazy strings, querysets...) go through DRF's own encoder, so
+    the output matches the stock renderer.
+    """
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=self.encoder.default, option=option)
+
+        # Escape the line/paragraph separators like JSONRenderer does, as
+        # they are valid in JSON but not in JavaScript string literals
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -1,5 +1,22 @@
 from rest_framework import serializers
-from pm.models.activity_models import ActivityLog
+from pm.models.activity_models import ActivityLog, ENTITY_NAME_KEYS
+
+# Description templates per action; filled with the user and entity type
+ACTION_DESCRIPTIONS = {
+    'CREATED': '{user} created {entity}',
+    'UPDATED': '{user} updated {entity}',
+    'DELETED': '{user} deleted {entity}',
+    'WORKSPACE_MEMBER_ADDED': '{user} added a member to workspace',
+    'WORKSPACE_MEMBER_REMOVED': '{user} removed a member from workspace',
+    'WORKSPACE_MEMBER_ROLE_CHANGED': '{user} changed member role in workspace',
+    'WORKSPACE_PROJECT_ACCESS_GRANTED': '{user} granted project access',
+    'WORKSPACE_PROJECT_ACCESS_REVOKED': '{user} revoked project access',
+    'PROJECT_MEMBER_ADDED': '{user} added a member to project',
+    'PROJECT_MEMBER_REMOVED': '{user} removed a member from project',
+    'TASK_ASSIGNED': '{user} assigned task',
+    'TASK_STATUS_CHANGED': '{user} changed task status',
+    'TASK_PRIORITY_CHANGED': '{user} changed task priority',
+}
 
 
 class ActivityLogSerializer(serializers.ModelSerializer):
@@ -24,16 +41,24 @@ class ActivityLogSerializer(serializers.ModelSerializer):
             'entity_display'
         ]
 
+    def to_representation(self, instance):
+        # Scan extra_info for entity names once per row. object_repr and
+        # entity_display show the most specific one, description the broadest.
+        extra_info = instance.extra_info
+        name_keys = [key for key in ENTITY_NAME_KEYS if key in extra_info] if extra_info else []
+        if name_keys:
+            instance._entity_display = extra_info[name_keys[0]]
+            instance._description_name = extra_info[name_keys[-1]]
+        else:
+            instance._entity_display = f'{instance.content_type} #{instance.object_id}'
+            instance._description_name = None
+        return super().to_representation(instance)
+
     def get_object_repr(self, obj):
         """
         Get a string representation of the object.
         """
-        if obj.extra_info:
-            # Try to get the most specific name
-            for key in ['task_title', 'sprint_name', 'milestone_name', 'project_name', 'workspace_name']:
-                if key in obj.extra_info:
-                    return obj.extra_info[key]
-        return f'{obj.content_type} #{obj.object_id}'
+        return obj._entity_display
     
     def get_changed_fields(self, obj):
         """
@@ -42,20 +67,22 @@ class ActivityLogSerializer(serializers.ModelSerializer):
         if obj.extra_info and 'changed_fields' in obj.extra_info:
             return obj.extra_info['changed_fields']
         
-        if obj.old_value and obj.new_value:
-            old_keys = set(obj.old_value.keys()) if isinstance(obj.old_value, dict) else set()
-            new_keys = set(obj.new_value.keys()) if isinstance(obj.new_value, dict) else set()
-            all_keys = old_keys | new_keys
-            
-            changed = []
-            for key in all_keys:
-                old_val = obj.old_value.get(key) if isinstance(obj.old_value, dict) else None
-                new_val = obj.new_value.get(key) if isinstance(obj.new_value, dict) else None
-                if old_val != new_val:
-                    changed.append(key)
-            return changed
-        
-        return []
+        old_value, new_value = obj.old_value, obj.new_value
+        if not (old_value and new_value):
+            return []
+        if not isinstance(old_value, dict):
+            old_value = {}
+        if not isinstance(new_value, dict):
+            new_value = {}
+
+        # Walk each dict once instead of building and iterating a key union;
+        # a key missing on one side compares as None, as before
+        changed = [key for key, value in old_value.items() if value != new_value.get(key)]
+        changed.extend(
+            key for key, value in new_value.items()
+            if key not in old_value and value is not None
+        )
+        return changed
     
     def get_description(self, obj):
         """
@@ -66,31 +93,14 @@ class ActivityLogSerializer(serializers.ModelSerializer):
         obj_id = obj.object_id
         
         # Get entity name if available
-        entity_name = None
-        if obj.extra_info:
-            for key in ['workspace_name', 'project_name', 'milestone_name', 'sprint_name', 'task_title']:
-                if key in obj.extra_info:
-                    entity_name = obj.extra_info[key]
-                    break
+        entity_name = obj._description_name
         
         # Get the specific action description
-        action_descriptions = {
-            'CREATED': f'{user_name} created {entity}',
-            'UPDATED': f'{user_name} updated {entity}',
-            'DELETED': f'{user_name} deleted {entity}',
-            'WORKSPACE_MEMBER_ADDED': f'{user_name} added a member to workspace',
-            'WORKSPACE_MEMBER_REMOVED': f'{user_name} removed a member from workspace',
-            'WORKSPACE_MEMBER_ROLE_CHANGED': f'{user_name} changed member role in workspace',
-            'WORKSPACE_PROJECT_ACCESS_GRANTED': f'{user_name} granted project access',
-            'WORKSPACE_PROJECT_ACCESS_REVOKED': f'{user_name} revoked project access',
-            'PROJECT_MEMBER_ADDED': f'{user_name} added a member to project',
-            'PROJECT_MEMBER_REMOVED': f'{user_name} removed a member from project',
-            'TASK_ASSIGNED': f'{user_name} assigned task',
-            'TASK_STATUS_CHANGED': f'{user_name} changed task status',
-            'TASK_PRIORITY_CHANGED': f'{user_name} changed task priority',
-        }
-        
-        desc = action_descriptions.get(obj.action, f'{user_name} performed {obj.action} on {entity}')
+        template = ACTION_DESCRIPTIONS.get(obj.action)
+        if template:
+            desc = template.format(user=user_name, entity=entity)
+        else:
+            desc = f'{user_name} performed {obj.action} on {entity}'
         
         if entity_name:
             desc += f' "{entity_name}"'
@@ -103,11 +113,5 @@ class ActivityLogSerializer(serializers.ModelSerializer):
         """
         Get a display name for the entity from extra_info.
         """
-        if obj.extra_info:
-            # Try to get the most specific name
-            for key in ['task_title', 'sprint_name', 'milestone_name', 'project_name', 'workspace_name']:
-                if key in obj.extra_info:
-                    return obj.extra_info[key]
-        
-        return f'{obj.content_type} #{obj.object_id}'
+        return obj._entity_display
 
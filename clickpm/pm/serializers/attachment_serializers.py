@@ -3,7 +3,7 @@ from pm.models.attachment_models import Attachment
 
 
 class AttachmentSerializer(serializers.ModelSerializer):
-    file_url = serializers.SerializerMethodField()
+    file_url = serializers.FileField(source='file', read_only=True)
     uploaded_by_name = serializers.CharField(source='uploaded_by.username', read_only=True)
 
     class Meta:
@@ -14,12 +14,6 @@ class AttachmentSerializer(serializers.ModelSerializer):
             'comment', 'task'
         ]
 
-    def get_file_url(self, obj):
-        request = self.context.get('request')
-        if obj.file and request:
-            return request.build_absolute_uri(obj.file.url)
-        return None
-
 
 class AttachmentCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -1,17 +1,10 @@
 from rest_framework import serializers
 from pm.models.comment_models import Comment
-
-
-class CommentAuthorSerializer(serializers.Serializer):
-    id = serializers.IntegerField()
-    username = serializers.CharField()
-    email = serializers.EmailField(required=False)
-    first_name = serializers.CharField(required=False)
-    last_name = serializers.CharField(required=False)
+from pm.serializers.user_serializers import UserMinimalField
 
 
 class CommentSerializer(serializers.ModelSerializer):
-    author = CommentAuthorSerializer(read_only=True)
+    author = UserMinimalField()
     task_title = serializers.CharField(source='task.title', read_only=True, allow_null=True)
     sprint_name = serializers.CharField(source='sprint.name', read_only=True, allow_null=True)
     project_name = serializers.CharField(source='project.name', read_only=True, allow_null=True)
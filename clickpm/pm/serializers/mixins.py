@@ -0,0 +1,16 @@
+from functools import cached_property
+
+
+class BoundFieldsCacheMixin:
+    """
+    Resolve a serializer's readable fields once per serializer instance.
+
+    DRF binds the fields of a list's child serializer once, but re-walks
+    them through the `_readable_fields` generator for every row rendered.
+    Nested many=True serializers render many rows per parent, so keep the
+    filtered fields as a tuple instead.
+    """
+
+    @cached_property
+    def _readable_fields(self):
+        return tuple(field for field in self.fields.values() if not field.write_only)
@@ -1,14 +1,16 @@
 from rest_framework import serializers
 from pm.models.notification_models import Notification
-from pm.serializers.user_serializers import UserMinimalSerializer
+from pm.serializers.user_serializers import UserMinimalField
 from django.contrib.contenttypes.models import ContentType
 
 
 class NotificationSerializer(serializers.ModelSerializer):
     """Serializer for Notification"""
-    actor = UserMinimalSerializer(read_only=True)
-    recipient = UserMinimalSerializer(read_only=True)
-    target_type = serializers.SerializerMethodField()
+    actor = UserMinimalField()
+    recipient = UserMinimalField()
+    target_type = serializers.CharField(
+        source='target_content_type.model', read_only=True, allow_null=True
+    )
     
     class Meta:
         model = Notification
@@ -17,12 +19,6 @@ class NotificationSerializer(serializers.ModelSerializer):
             'target_type', 'target_object_id', 'read', 'timestamp'
         ]
         read_only_fields = ['timestamp']
-    
-    def get_target_type(self, obj):
-        """Get readable target type name"""
-        if obj.target_content_type:
-            return obj.target_content_type.model
-        return None
 
 
 class NotificationCreateSerializer(serializers.ModelSerializer):
@@ -1,9 +1,55 @@
+from django.db import models
+from django.db.models import Prefetch
 from rest_framework import serializers
 from pm.models.project_models import Project, ProjectMember, Milestone, Sprint
+from pm.serializers.mixins import BoundFieldsCacheMixin
 from pm.serializers.user_serializers import UserMinimalSerializer, RoleSerializer
 
 
-class ProjectMemberSerializer(serializers.ModelSerializer):
+class CompletionListSerializer(serializers.ListSerializer):
+    """
+    Computes completion_percentage for a whole list with the model's
+    completion_percentages() batch classmethod instead of once per row.
+    """
+
+    def to_representation(self, data):
+        objs = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        set_completion_percentages(self.child, objs)
+        return super().to_representation(objs)
+
+
+def set_completion_percentages(serializer, objs):
+    """
+    Batch-compute completion for objs, then for the nested completion lists
+    of every obj at once through their prefetched relations, so nested
+    lists cost one query per level rather than one per parent.
+    """
+    pending = [obj for obj in objs if getattr(obj, '_completion_percentage', None) is None]
+    if pending:
+        percentages = serializer.Meta.model.completion_percentages([obj.pk for obj in pending])
+        for obj in pending:
+            obj._completion_percentage = percentages[obj.pk]
+
+    for field in serializer.fields.values():
+        if isinstance(field, CompletionListSerializer):
+            # Prefetched rows are the same instances the nested list renders
+            nested = [
+                child
+                for obj in objs
+                for child in getattr(obj, '_prefetched_objects_cache', {}).get(field.source, ())
+            ]
+            set_completion_percentages(field.child, nested)
+
+
+def get_completion_percentage(obj):
+    """Batch-computed percentage when listed, computed on demand otherwise"""
+    percentage = getattr(obj, '_completion_percentage', None)
+    if percentage is None:
+        percentage = obj.calculate_completion_percentage()
+    return round(percentage, 2)
+
+
+class ProjectMemberSerializer(BoundFieldsCacheMixin, serializers.ModelSerializer):
     user = UserMinimalSerializer(read_only=True)
     role = RoleSerializer(read_only=True)
 
@@ -12,11 +58,12 @@ class ProjectMemberSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'role', 'joined_at']
 
 
-class SprintSerializer(serializers.ModelSerializer):
+class SprintSerializer(BoundFieldsCacheMixin, serializers.ModelSerializer):
     completion_percentage = serializers.SerializerMethodField()
     
     class Meta:
         model = Sprint
+        list_serializer_class = CompletionListSerializer
         fields = [
             'id', 'milestone', 'name', 'description', 'start_date', 'end_date',
             'status', 'completion_percentage', 
@@ -24,7 +71,7 @@ class SprintSerializer(serializers.ModelSerializer):
         ]
     
     def get_completion_percentage(self, obj):
-        return round(obj.calculate_completion_percentage(), 2)
+        return get_completion_percentage(obj)
 
 
 class SprintDetailSerializer(serializers.ModelSerializer):
@@ -33,21 +80,23 @@ class SprintDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Sprint
+        list_serializer_class = CompletionListSerializer
         fields = [
             'id', 'milestone', 'milestone_name', 'name', 'description', 'start_date', 'end_date',
             'status', 'completion_percentage', 'created_at', 'updated_at'
         ]
 
     def get_completion_percentage(self, obj):
-        return round(obj.calculate_completion_percentage(), 2)
+        return get_completion_percentage(obj)
 
 
-class MilestoneSerializer(serializers.ModelSerializer):
+class MilestoneSerializer(BoundFieldsCacheMixin, serializers.ModelSerializer):
     sprints = SprintSerializer(many=True, read_only=True)
     completion_percentage = serializers.SerializerMethodField()
 
     class Meta:
         model = Milestone
+        list_serializer_class = CompletionListSerializer
         fields = [
             'id', 'project', 'name', 'description', 'start_date', 'end_date',
             'status', 'sprints', 'completion_percentage', 
@@ -55,7 +104,12 @@ class MilestoneSerializer(serializers.ModelSerializer):
         ]
     
     def get_completion_percentage(self, obj):
-        return round(obj.calculate_completion_percentage(), 2)
+        return get_completion_percentage(obj)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Prefetch the nested sprints"""
+        return queryset.prefetch_related('sprints')
 
 
 class MilestoneDetailSerializer(serializers.ModelSerializer):
@@ -65,13 +119,27 @@ class MilestoneDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Milestone
+        list_serializer_class = CompletionListSerializer
         fields = [
             'id', 'project', 'project_name', 'name', 'description', 'start_date', 'end_date',
             'status', 'sprints', 'completion_percentage', 'created_at', 'updated_at'
         ]
 
     def get_completion_percentage(self, obj):
-        return round(obj.calculate_completion_percentage(), 2)
+        return get_completion_percentage(obj)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the project and prefetch the nested sprints"""
+        return queryset.select_related('project').prefetch_related('sprints')
+
+
+def _project_eager_loading(queryset):
+    """Join/prefetch everything ProjectSerializer and ProjectDetailSerializer render"""
+    return queryset.select_related('workspace').prefetch_related(
+        Prefetch('projectmember_set', queryset=ProjectMember.objects.select_related('user', 'role')),
+        'milestones__sprints',
+    )
 
 
 class ProjectSerializer(serializers.ModelSerializer):
@@ -82,6 +150,7 @@ class ProjectSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Project
+        list_serializer_class = CompletionListSerializer
         fields = [
             'id', 'name', 'description', 'start_date', 'end_date',
             'status', 'workspace', 'workspace_name', 'members', 'milestones',
@@ -89,7 +158,11 @@ class ProjectSerializer(serializers.ModelSerializer):
         ]
     
     def get_completion_percentage(self, obj):
-        return round(obj.calculate_completion_percentage(), 2)
+        return get_completion_percentage(obj)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return _project_eager_loading(queryset)
 
 
 class ProjectDetailSerializer(serializers.ModelSerializer):
@@ -105,6 +178,10 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
             'tags', 'archived', 'created_at', 'updated_at'
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return _project_eager_loading(queryset)
+
 
 class ProjectCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -1,10 +1,12 @@
+from django.db.models import Prefetch
 from rest_framework import serializers
 
 from pm.models.task_models import Task, TaskDependency
-from pm.serializers.user_serializers import UserMinimalSerializer
+from pm.serializers.mixins import BoundFieldsCacheMixin
+from pm.serializers.user_serializers import UserMinimalField
 
 
-class TaskDependencySerializer(serializers.ModelSerializer):
+class TaskDependencySerializer(BoundFieldsCacheMixin, serializers.ModelSerializer):
     depends_on_title = serializers.CharField(source='depends_on.title', read_only=True)
 
     class Meta:
@@ -13,8 +15,8 @@ class TaskDependencySerializer(serializers.ModelSerializer):
 
 
 class TaskSerializer(serializers.ModelSerializer):
-    assignee_details = UserMinimalSerializer(source='assignee', read_only=True)
-    reporter_details = UserMinimalSerializer(source='reporter', read_only=True)
+    assignee_details = UserMinimalField(source='assignee')
+    reporter_details = UserMinimalField(source='reporter')
     dependencies = TaskDependencySerializer(source='dependent_on', many=True, read_only=True)
     sprint_name = serializers.CharField(source='sprint.name', read_only=True)
 
@@ -26,11 +28,18 @@ class TaskSerializer(serializers.ModelSerializer):
             'due_date', 'dependencies', 'created_at', 'updated_at'
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join/prefetch the users, sprint and dependencies rendered per task"""
+        return queryset.select_related('sprint', 'assignee', 'reporter').prefetch_related(
+            Prefetch('dependent_on', queryset=TaskDependency.objects.select_related('depends_on'))
+        )
+
 
 class TaskDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer with related fields for retrieve view"""
-    assignee_details = UserMinimalSerializer(source='assignee', read_only=True)
-    reporter_details = UserMinimalSerializer(source='reporter', read_only=True)
+    assignee_details = UserMinimalField(source='assignee')
+    reporter_details = UserMinimalField(source='reporter')
     dependencies = TaskDependencySerializer(source='dependent_on', many=True, read_only=True)
     sprint_name = serializers.CharField(source='sprint.name', read_only=True)
     sprint_details = serializers.SerializerMethodField()
@@ -44,13 +53,20 @@ class TaskDetailSerializer(serializers.ModelSerializer):
             'dependencies', 'created_at', 'updated_at'
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """TaskSerializer's loading plus the sprint's milestone and project"""
+        return TaskSerializer.setup_eager_loading(queryset).select_related('sprint__milestone__project')
+
     def get_sprint_details(self, obj):
-        if obj.sprint:
-            milestone = obj.sprint.milestone
+        # Reads the rows joined by setup_eager_loading; no queries
+        sprint = obj.sprint
+        if sprint:
+            milestone = sprint.milestone
             project = milestone.project if milestone else None
             return {
-                'id': obj.sprint.id,
-                'name': obj.sprint.name,
+                'id': sprint.id,
+                'name': sprint.name,
                 'milestone': {
                     'id': milestone.id,
                     'name': milestone.name,
@@ -10,6 +10,27 @@ class UserMinimalSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class UserMinimalField(serializers.Field):
+    """
+    Read-only field with UserMinimalSerializer's output, built as a single
+    dict rather than through a nested serializer's per-field loop.
+    Meant for the user columns of list serializers.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, user):
+        return {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+        }
+
+
 class RoleSerializer(serializers.ModelSerializer):
     class Meta:
         model = Role
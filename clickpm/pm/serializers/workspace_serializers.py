@@ -1,5 +1,8 @@
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
 from pm.models.workspace_models import Workspace, WorkspaceMember
+from pm.models.project_models import Project
 from pm.models.user_models import User
 from pm.serializers.user_serializers import UserSerializer
 
@@ -15,6 +18,14 @@ class WorkspaceMemberSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'joined_at']
 
 
+def _count_per_workspace(model):
+    """Subquery counting the model's rows for the outer workspace"""
+    return Subquery(
+        model.objects.filter(workspace=OuterRef('pk')).order_by().values('workspace')
+        .annotate(count=Count('pk')).values('count')
+    )
+
+
 class WorkspaceSerializer(serializers.ModelSerializer):
     """Basic workspace serializer for list views"""
     owner = UserSerializer(read_only=True)
@@ -26,10 +37,25 @@ class WorkspaceSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'owner', 'member_count', 'project_count', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at']
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Join the owner and annotate both counts. Correlated subqueries keep
+        the counts right when the queryset already joins members to filter.
+        """
+        return queryset.select_related('owner__role').annotate(
+            _member_count=Coalesce(_count_per_workspace(WorkspaceMember), 0),
+            _project_count=Coalesce(_count_per_workspace(Project), 0),
+        )
+
     def get_member_count(self, obj):
+        if hasattr(obj, '_member_count'):
+            return obj._member_count
         return obj.members.count()
     
     def get_project_count(self, obj):
+        if hasattr(obj, '_project_count'):
+            return obj._project_count
         return obj.projects.count()
 
 
@@ -43,6 +69,13 @@ class WorkspaceDetailSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'owner', 'workspace_members', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the owner and prefetch the members with their users and roles"""
+        return queryset.select_related('owner__role').prefetch_related(
+            Prefetch('workspacemember_set', queryset=WorkspaceMember.objects.select_related('user__role'))
+        )
+
 
 class WorkspaceCreateUpdateSerializer(serializers.ModelSerializer):
     """Serializer for creating and updating workspaces"""
@@ -16,8 +16,10 @@ Captures:
 ✅ Old → New state (for updates)
 """
 
-from typing import Optional, Any, Dict
-from django.db.models import Model
+from functools import lru_cache
+from typing import Optional, Any, Dict, Tuple
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import DateField, Model, TimeField
 from pm.models.activity_models import ActivityLog
 
 
@@ -74,16 +76,37 @@ class EntityType:
     PROJECT_MEMBER = 'ProjectMember'
 
 
+# Default fields to audit for each model type
+DEFAULT_AUDIT_FIELDS = {
+    'Workspace': ('id', 'name', 'description', 'owner'),
+    'Project': ('id', 'name', 'description', 'status', 'visibility',
+                'start_date', 'end_date', 'archived', 'workspace'),
+    'Milestone': ('id', 'name', 'description', 'status', 'start_date',
+                  'end_date', 'project'),
+    'Sprint': ('id', 'name', 'description', 'status', 'start_date',
+               'end_date', 'milestone'),
+    'Task': ('id', 'title', 'description', 'status', 'priority',
+             'assignee', 'reporter', 'start_date', 'due_date', 'sprint'),
+    'WorkspaceMember': ('id', 'user', 'workspace', 'is_admin', 'role'),
+    'ProjectMember': ('id', 'user', 'project', 'role'),
+}
+
+
 # =============================================
 # MODEL SERIALIZATION HELPERS
 # =============================================
-def serialize_model_state(instance: Model, fields: Optional[list] = None) -> Dict[str, Any]:
+def serialize_model_state(
+    instance: Model,
+    fields: Optional[list] = None,
+    model_name: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Serialize a model instance to a dictionary for audit logging.
     
     Args:
         instance: Django model instance
         fields: Optional list of specific fields to serialize
+        model_name: type(instance).__name__, if the caller already has it
         
     Returns:
         Dictionary representation of the model state
@@ -94,24 +117,27 @@ def serialize_model_state(instance: Model, fields: Optional[list] = None) -> Dic
     data = {}
     
     # Default fields to capture based on model type
-    model_name = type(instance).__name__
+    model = type(instance)
+    field_list = fields or DEFAULT_AUDIT_FIELDS.get(model_name or model.__name__, ('id',))
     
-    if fields:
-        field_list = fields
-    else:
-        field_list = get_default_fields_for_model(model_name)
-    
-    for field in field_list:
+    # How to render each field is resolved once per model from _meta
+    for field, kind in field_kinds(model, tuple(field_list)):
         try:
-            value = getattr(instance, field, None)
-            
-            # Handle foreign keys - get the ID and string representation
-            if hasattr(value, 'pk'):
+            if kind == FIELD_MISSING:
+                # Not a model field (e.g. a property): probe the value
+                data[field] = _probe_state_value(getattr(instance, field, None))
+                continue
+
+            value = getattr(instance, field)
+            if value is None:
+                data[field] = None
+            elif kind == FIELD_RELATION:
+                # Handle foreign keys - get the ID and string representation
                 data[field] = {
                     'id': value.pk,
                     'display': str(value)
                 }
-            elif hasattr(value, 'isoformat'):
+            elif kind == FIELD_DATE:
                 # Handle date/datetime fields
                 data[field] = value.isoformat()
             else:
@@ -122,24 +148,44 @@ def serialize_model_state(instance: Model, fields: Optional[list] = None) -> Dic
     return data
 
 
-def get_default_fields_for_model(model_name: str) -> list:
-    """Get default fields to audit for each model type"""
-    
-    field_mapping = {
-        'Workspace': ['id', 'name', 'description', 'owner'],
-        'Project': ['id', 'name', 'description', 'status', 'visibility', 
-                   'start_date', 'end_date', 'archived', 'workspace'],
-        'Milestone': ['id', 'name', 'description', 'status', 'start_date', 
-                     'end_date', 'project'],
-        'Sprint': ['id', 'name', 'description', 'status', 'start_date', 
-                  'end_date', 'milestone'],
-        'Task': ['id', 'title', 'description', 'status', 'priority',
-                'assignee', 'reporter', 'start_date', 'due_date', 'sprint'],
-        'WorkspaceMember': ['id', 'user', 'workspace', 'is_admin', 'role'],
-        'ProjectMember': ['id', 'user', 'project', 'role'],
-    }
-    
-    return field_mapping.get(model_name, ['id'])
+def _probe_state_value(value):
+    """Render a value whose kind is not known from the model's fields"""
+    if hasattr(value, 'pk'):
+        return {'id': value.pk, 'display': str(value)}
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+# Value kinds for field_kinds(): how serialize_model_state renders a field
+FIELD_VALUE = 'value'
+FIELD_RELATION = 'relation'
+FIELD_DATE = 'date'
+FIELD_MISSING = 'missing'
+
+
+@lru_cache(maxsize=None)
+def field_kinds(model, fields: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Resolve audited field names against the model's _meta, once per
+    (model, fields) pair.
+
+    Returns (name, kind) tuples.
+    """
+    kinds = []
+    for name in fields:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            kinds.append((name, FIELD_MISSING))
+            continue
+        if field.many_to_one or field.one_to_one:
+            kinds.append((name, FIELD_RELATION))
+        elif isinstance(field, (DateField, TimeField)):
+            kinds.append((name, FIELD_DATE))
+        else:
+            kinds.append((name, FIELD_VALUE))
+    return tuple(kinds)
 
 
 def compute_changes(old_state: Dict, new_state: Dict) -> Dict[str, Dict]:
@@ -153,11 +199,11 @@ def compute_changes(old_state: Dict, new_state: Dict) -> Dict[str, Dict]:
         return {}
     
     changes = {}
-    all_keys = set(old_state.keys()) | set(new_state.keys())
     
-    for key in all_keys:
+    # Walk each state once instead of building a key union; a key missing
+    # on one side compares as None
+    for key, new_val in new_state.items():
         old_val = old_state.get(key)
-        new_val = new_state.get(key)
         
         # Normalize comparison for nested dicts (foreign keys)
         if isinstance(old_val, dict) and isinstance(new_val, dict):
@@ -166,80 +212,95 @@ def compute_changes(old_state: Dict, new_state: Dict) -> Dict[str, Dict]:
         elif old_val != new_val:
             changes[key] = {'old': old_val, 'new': new_val}
     
+    for key, old_val in old_state.items():
+        if old_val is not None and key not in new_state:
+            changes[key] = {'old': old_val, 'new': None}
+    
     return changes
 
 
 # =============================================
 # CONTEXT HELPER - Get hierarchy info
 # =============================================
-def get_entity_context(instance: Model) -> Dict[str, Any]:
+# values() lookups behind each context key, per model. Workspace needs no
+# query; every other model reads its whole hierarchy in one query.
+_CONTEXT_LOOKUPS = {
+    'Project': {
+        'workspace_id': 'workspace_id',
+        'workspace_name': 'workspace__name',
+        'project_id': 'id',
+        'project_name': 'name',
+    },
+    'Milestone': {
+        'workspace_id': 'project__workspace_id',
+        'workspace_name': 'project__workspace__name',
+        'project_id': 'project_id',
+        'project_name': 'project__name',
+        'milestone_id': 'id',
+        'milestone_name': 'name',
+    },
+    'Sprint': {
+        'workspace_id': 'milestone__project__workspace_id',
+        'workspace_name': 'milestone__project__workspace__name',
+        'project_id': 'milestone__project_id',
+        'project_name': 'milestone__project__name',
+        'milestone_id': 'milestone_id',
+        'milestone_name': 'milestone__name',
+        'sprint_id': 'id',
+        'sprint_name': 'name',
+    },
+    'Task': {
+        'workspace_id': 'sprint__milestone__project__workspace_id',
+        'workspace_name': 'sprint__milestone__project__workspace__name',
+        'project_id': 'sprint__milestone__project_id',
+        'project_name': 'sprint__milestone__project__name',
+        'milestone_id': 'sprint__milestone_id',
+        'milestone_name': 'sprint__milestone__name',
+        'sprint_id': 'sprint_id',
+        'sprint_name': 'sprint__name',
+        'task_id': 'id',
+        'task_title': 'title',
+    },
+    'WorkspaceMember': {
+        'workspace_id': 'workspace_id',
+        'workspace_name': 'workspace__name',
+        'member_user_id': 'user_id',
+        'member_username': 'user__username',
+    },
+    'ProjectMember': {
+        'workspace_id': 'project__workspace_id',
+        'workspace_name': 'project__workspace__name',
+        'project_id': 'project_id',
+        'project_name': 'project__name',
+        'member_user_id': 'user_id',
+        'member_username': 'user__username',
+    },
+}
+
+
+def get_entity_context(instance: Model, model_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Get the hierarchical context for an entity (workspace, project info).
     This helps in filtering audit logs by workspace/project.
+
+    The whole chain is read with a single values() query instead of
+    walking one relation (and one query) per level. Pass model_name when
+    the caller already has type(instance).__name__.
     """
-    context = {}
-    model_name = type(instance).__name__
-    
-    try:
-        if model_name == 'Workspace':
-            context['workspace_id'] = instance.id
-            context['workspace_name'] = instance.name
-            
-        elif model_name == 'Project':
-            context['workspace_id'] = instance.workspace_id
-            context['workspace_name'] = instance.workspace.name
-            context['project_id'] = instance.id
-            context['project_name'] = instance.name
-            
-        elif model_name == 'Milestone':
-            context['workspace_id'] = instance.project.workspace_id
-            context['workspace_name'] = instance.project.workspace.name
-            context['project_id'] = instance.project_id
-            context['project_name'] = instance.project.name
-            context['milestone_id'] = instance.id
-            context['milestone_name'] = instance.name
-            
-        elif model_name == 'Sprint':
-            context['workspace_id'] = instance.milestone.project.workspace_id
-            context['workspace_name'] = instance.milestone.project.workspace.name
-            context['project_id'] = instance.milestone.project_id
-            context['project_name'] = instance.milestone.project.name
-            context['milestone_id'] = instance.milestone_id
-            context['milestone_name'] = instance.milestone.name
-            context['sprint_id'] = instance.id
-            context['sprint_name'] = instance.name
-            
-        elif model_name == 'Task':
-            context['workspace_id'] = instance.sprint.milestone.project.workspace_id
-            context['workspace_name'] = instance.sprint.milestone.project.workspace.name
-            context['project_id'] = instance.sprint.milestone.project_id
-            context['project_name'] = instance.sprint.milestone.project.name
-            context['milestone_id'] = instance.sprint.milestone_id
-            context['milestone_name'] = instance.sprint.milestone.name
-            context['sprint_id'] = instance.sprint_id
-            context['sprint_name'] = instance.sprint.name
-            context['task_id'] = instance.id
-            context['task_title'] = instance.title
-            
-        elif model_name == 'WorkspaceMember':
-            context['workspace_id'] = instance.workspace_id
-            context['workspace_name'] = instance.workspace.name
-            context['member_user_id'] = instance.user_id
-            context['member_username'] = instance.user.username
-            
-        elif model_name == 'ProjectMember':
-            context['workspace_id'] = instance.project.workspace_id
-            context['workspace_name'] = instance.project.workspace.name
-            context['project_id'] = instance.project_id
-            context['project_name'] = instance.project.name
-            context['member_user_id'] = instance.user_id
-            context['member_username'] = instance.user.username
-            
-    except AttributeError:
-        # Handle cases where related objects might be None
-        pass
-    
-    return context
+    model = type(instance)
+    model_name = model_name or model.__name__
+
+    if model_name == 'Workspace':
+        return {'workspace_id': instance.id, 'workspace_name': instance.name}
+
+    lookups = _CONTEXT_LOOKUPS.get(model_name)
+    if lookups is None or instance.pk is None:
+        return {}
+
+    row = model._default_manager.filter(pk=instance.pk).values(*lookups.values()).first()
+    if row is None:
+        return {}
+    return {key: row[lookup] for key, lookup in lookups.items()}
 
 
 # =============================================
@@ -281,8 +342,9 @@ class AuditService:
         extra_info: Optional[Dict] = None
     ) -> ActivityLog:
         """Log a CREATE event"""
-        new_state = serialize_model_state(instance)
-        context = get_entity_context(instance)
+        model_name = type(instance).__name__
+        new_state = serialize_model_state(instance, model_name=model_name)
+        context = get_entity_context(instance, model_name)
         
         # Merge extra_info with context
         final_extra_info = {**context, **(extra_info or {})}
@@ -290,7 +352,7 @@ class AuditService:
         return ActivityLog.objects.create(
             user=user,
             action=EventType.CREATED,
-            content_type=type(instance).__name__,
+            content_type=model_name,
             object_id=instance.id,
             reason=reason,
             old_value=None,
@@ -318,8 +380,9 @@ class AuditService:
             extra_info: Additional context
             fields: Specific fields to track (if None, uses defaults)
         """
-        new_state = serialize_model_state(instance, fields)
-        context = get_entity_context(instance)
+        model_name = type(instance).__name__
+        new_state = serialize_model_state(instance, fields, model_name)
+        context = get_entity_context(instance, model_name)
         
         # Compute changes for easier querying
         changes = compute_changes(old_state, new_state) if old_state else {}
@@ -334,7 +397,7 @@ class AuditService:
         return ActivityLog.objects.create(
             user=user,
             action=EventType.UPDATED,
-            content_type=type(instance).__name__,
+            content_type=model_name,
             object_id=instance.id,
             reason=reason,
             old_value=old_state,
@@ -350,15 +413,16 @@ class AuditService:
         extra_info: Optional[Dict] = None
     ) -> ActivityLog:
         """Log a DELETE event - captures the final state before deletion"""
-        old_state = serialize_model_state(instance)
-        context = get_entity_context(instance)
+        model_name = type(instance).__name__
+        old_state = serialize_model_state(instance, model_name=model_name)
+        context = get_entity_context(instance, model_name)
         
         final_extra_info = {**context, **(extra_info or {})}
         
         return ActivityLog.objects.create(
             user=user,
             action=EventType.DELETED,
-            content_type=type(instance).__name__,
+            content_type=model_name,
             object_id=instance.id,
             reason=reason,
             old_value=old_state,
@@ -384,13 +448,14 @@ class AuditService:
         - Status transitions
         - Permission changes
         """
-        context = get_entity_context(instance)
+        model_name = type(instance).__name__
+        context = get_entity_context(instance, model_name)
         final_extra_info = {**context, **(extra_info or {})}
         
         return ActivityLog.objects.create(
             user=user,
             action=action,
-            content_type=type(instance).__name__,
+            content_type=model_name,
             object_id=instance.id,
             reason=reason,
             old_value=old_state,
@@ -6,7 +6,8 @@ Hierarchy: Task → Sprint → Milestone → Project → Workspace
 """
 
 import logging
-from django.db.models import Count, Q
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from pm.models.task_models import Task
 from pm.models.project_models import Sprint, Milestone, Project
 from pm.models.workspace_models import Workspace
@@ -14,6 +15,29 @@ from pm.models.notification_models import Notification
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT when notifying every member of a project or workspace
+NOTIFICATION_BATCH_SIZE = 500
+
+
+def _count(model, parent, outer_ref, **filters):
+    """Subquery counting the model's rows (optionally filtered) under the outer row's parent"""
+    return Coalesce(Subquery(
+        model.objects.filter(**{parent: OuterRef(outer_ref)}, **filters).order_by()
+        .values(parent).annotate(count=Count('pk')).values('count')
+    ), 0)
+
+
+def _mark_completed(model, obj):
+    """
+    Set obj's status to 'Completed' with one conditional UPDATE unless it
+    already is. Returns True only for the caller that flipped it, so
+    concurrent completions notify and move up the hierarchy once.
+    """
+    if not model.objects.filter(pk=obj.pk).exclude(status='Completed').update(status='Completed'):
+        return False
+    obj.status = 'Completed'
+    return True
+
 
 class AutoCompletionService:
     """
@@ -37,102 +61,110 @@ class AutoCompletionService:
             return
         
         # Start the chain reaction
-        AutoCompletionService._check_and_complete_sprint(task.sprint)
+        AutoCompletionService._check_and_complete_sprint(task.sprint_id)
+    
+    @staticmethod
+    def _completion_counts(sprint_id):
+        """
+        Load the sprint with its whole parent chain and the child counts of
+        every level (tasks, sprints, milestones, projects) in one query.
+        """
+        return Sprint.objects.select_related('milestone__project__workspace').annotate(
+            total_tasks=_count(Task, 'sprint', 'pk'),
+            done_tasks=_count(Task, 'sprint', 'pk', status='Done'),
+            total_sprints=_count(Sprint, 'milestone', 'milestone_id'),
+            completed_sprints=_count(Sprint, 'milestone', 'milestone_id', status='Completed'),
+            total_milestones=_count(Milestone, 'project', 'milestone__project_id'),
+            completed_milestones=_count(Milestone, 'project', 'milestone__project_id', status='Completed'),
+            total_projects=_count(Project, 'workspace', 'milestone__project__workspace_id'),
+            completed_projects=_count(Project, 'workspace', 'milestone__project__workspace_id', status='Completed'),
+        ).filter(pk=sprint_id).first()
     
     @staticmethod
-    def _check_and_complete_sprint(sprint):
+    def _check_and_complete_sprint(sprint_id):
         """Check if all tasks in a sprint are done, and complete it if so"""
-        if not sprint:
+        if not sprint_id:
+            return
+        
+        sprint = AutoCompletionService._completion_counts(sprint_id)
+        if sprint is None:
             return
         
         # Check if all tasks in this sprint are done
-        total_tasks = sprint.tasks.count()
+        total_tasks = sprint.total_tasks
         if total_tasks == 0:
             return
         
-        done_tasks = sprint.tasks.filter(status='Done').count()
-        
-        if done_tasks == total_tasks:
+        if sprint.done_tasks == total_tasks:
             # All tasks are done! Mark sprint as completed
-            if sprint.status != 'Completed':
-                sprint.status = 'Completed'
-                sprint.save(update_fields=['status'])
-                
+            if _mark_completed(Sprint, sprint):
                 # Create notification
                 AutoCompletionService._create_completion_notification(
                     sprint, 'Sprint', f'All {total_tasks} tasks completed!'
                 )
                 
-                # Trigger next level
-                AutoCompletionService._check_and_complete_milestone(sprint.milestone)
+                # Trigger next level. The counts were read before this
+                # sprint was completed, so it is added on here.
+                AutoCompletionService._check_and_complete_milestone(
+                    sprint.milestone, sprint.total_sprints, sprint.completed_sprints + 1, sprint
+                )
     
     @staticmethod
-    def _check_and_complete_milestone(milestone):
+    def _check_and_complete_milestone(milestone, total_sprints, completed_sprints, counts):
         """Check if all sprints in a milestone are done, and complete it if so"""
         if not milestone:
             return
         
         # Check if all sprints in this milestone are completed
-        total_sprints = milestone.sprints.count()
         if total_sprints == 0:
             return
         
-        completed_sprints = milestone.sprints.filter(status='Completed').count()
-        
         if completed_sprints == total_sprints:
             # All sprints are completed! Mark milestone as completed
-            if milestone.status != 'Completed':
-                milestone.status = 'Completed'
-                milestone.save(update_fields=['status'])
-                
+            if _mark_completed(Milestone, milestone):
                 # Create notification
                 AutoCompletionService._create_completion_notification(
                     milestone, 'Milestone', f'All {total_sprints} sprints completed!'
                 )
                 
                 # Trigger next level
-                AutoCompletionService._check_and_complete_project(milestone.project)
+                AutoCompletionService._check_and_complete_project(
+                    milestone.project, counts.total_milestones, counts.completed_milestones + 1, counts
+                )
     
     @staticmethod
-    def _check_and_complete_project(project):
+    def _check_and_complete_project(project, total_milestones, completed_milestones, counts):
         """Check if all milestones in a project are done, and complete it if so"""
         if not project:
             return
         
         # Check if all milestones in this project are completed
-        total_milestones = project.milestones.count()
         if total_milestones == 0:
             return
         
-        completed_milestones = project.milestones.filter(status='Completed').count()
-        
         if completed_milestones == total_milestones:
             # All milestones are completed! Mark project as completed
-            if project.status != 'Completed':
-                project.status = 'Completed'
-                project.save(update_fields=['status'])
-                
+            if _mark_completed(Project, project):
                 # Create notification
                 AutoCompletionService._create_completion_notification(
                     project, 'Project', f'All {total_milestones} milestones completed!'
                 )
                 
                 # Trigger next level
-                AutoCompletionService._check_and_complete_workspace(project.workspace)
+                AutoCompletionService._check_and_complete_workspace(
+                    project.workspace, counts.total_projects, counts.completed_projects + 1
+                )
     
     @staticmethod
-    def _check_and_complete_workspace(workspace):
+    def _check_and_complete_workspace(workspace, total_projects, completed_projects):
         """Check if all projects in a workspace are done"""
         if not workspace:
             return
         
         # Check if all projects in this workspace are completed
-        total_projects = workspace.projects.count()
         if total_projects == 0:
             return
         
-        completed_projects = workspace.projects.filter(status='Completed').count()
-        
         if completed_projects == total_projects:
             # All projects are completed! Workspace is complete!
             # Note: Workspace doesn't have a status field, so just notify
@@ -156,17 +188,19 @@ class AutoCompletionService:
             else:
                 return
             
-            # Create notifications for all project members
-            members = project.members.all()
-            for member in members:
-                Notification.objects.create(
-                    recipient=member,
+            # Create notifications for all project members in one INSERT
+            verb = f'{obj_type} "{obj.name}" auto-completed: {message}'
+            Notification.objects.bulk_create([
+                Notification(
+                    recipient_id=member_id,
                     actor=None,  # System notification
-                    verb=f'{obj_type} "{obj.name}" auto-completed: {message}',
+                    verb=verb,
                     notification_type='general',
                     target_object_id=obj.id,
                     target_content_type=None  # Can be enhanced with ContentType
                 )
+                for member_id in project.members.values_list('id', flat=True)
+            ], batch_size=NOTIFICATION_BATCH_SIZE)
             logger.info(f"Auto-completion notification created for {obj_type} '{obj.name}'")
         except Exception as e:
             # Don't fail the completion if notification fails
@@ -176,16 +210,18 @@ class AutoCompletionService:
     def _create_workspace_completion_notification(workspace, total_projects):
         """Create a special notification for workspace completion"""
         try:
-            # Notify all workspace members
-            members = workspace.members.all()
-            for member in members:
-                Notification.objects.create(
-                    recipient=member,
+            # Notify all workspace members in one INSERT
+            verb = f'Workspace "{workspace.name}" COMPLETED! All {total_projects} projects have been completed!'
+            Notification.objects.bulk_create([
+                Notification(
+                    recipient_id=member_id,
                     actor=None,  # System notification
-                    verb=f'Workspace "{workspace.name}" COMPLETED! All {total_projects} projects have been completed!',
+                    verb=verb,
                     notification_type='general',
                     target_object_id=workspace.id,
                 )
+                for member_id in workspace.members.values_list('id', flat=True)
+            ], batch_size=NOTIFICATION_BATCH_SIZE)
             logger.info(f"Workspace completion notification created for '{workspace.name}'")
         except Exception as e:
             logger.error(f"Failed to create workspace completion notification: {e}")
@@ -0,0 +1,36 @@
+"""
+Work moved off the request thread.
+
+run_after_commit() hands a callable to a small per-process thread pool once
+the current transaction commits (right away outside a transaction). It is
+meant for notification emails, which the response does not depend on and
+which may be lost if a send fails or the process is killed. Database writes
+the app relies on, such as activity logs, must not go through it.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+# Worker threads shared by all requests of a process
+BACKGROUND_WORKERS = 2
+
+_executor = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix='pm-background')
+
+
+def _run(func, args, kwargs):
+    """Run func on a worker thread and release that thread's DB connection"""
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception(f"Background call to {getattr(func, '__qualname__', func)} failed")
+    finally:
+        connection.close()
+
+
+def run_after_commit(func, *args, **kwargs):
+    """Call func(*args, **kwargs) on a worker thread after the current transaction commits"""
+    transaction.on_commit(lambda: _executor.submit(_run, func, args, kwargs))
@@ -1,7 +1,8 @@
-from django.core.mail import send_mail, EmailMultiAlternatives
+from django.core.mail import send_mail, send_mass_mail, EmailMultiAlternatives
 from django.conf import settings
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
+from pm.services.background import run_after_commit
 import logging
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,20 @@ class EmailService:
             logger.error(f"Failed to send email to {to_email}: {e}")
             return False
 
+    @staticmethod
+    def queue_email(to_email, subject, message, html_message=None):
+        """
+        Send an email from a background thread once the current transaction
+        commits, keeping the SMTP round trip out of the request.
+        Returns True if queued, False if email notifications are disabled.
+        """
+        if not EmailService.is_enabled():
+            logger.info(f"Email notifications disabled. Skipping email to {to_email}")
+            return False
+
+        run_after_commit(EmailService.send_email, to_email, subject, message, html_message)
+        return True
+
     @staticmethod
     def send_task_assignment_email(user, task):
         """
@@ -74,7 +89,7 @@ Best regards,
 ClickPM Team
 """
 
-        return EmailService.send_email(user.email, subject, message)
+        return EmailService.queue_email(user.email, subject, message)
 
     @staticmethod
     def send_task_status_change_email(user, task, old_status, new_status):
@@ -97,12 +112,12 @@ Best regards,
 ClickPM Team
 """
 
-        return EmailService.send_email(user.email, subject, message)
+        return EmailService.queue_email(user.email, subject, message)
 
     @staticmethod
-    def send_deadline_reminder_email(user, target, target_type, days_until):
+    def build_deadline_reminder_email(username, name, target_type, due_date, days_until):
         """
-        Send email reminder for upcoming deadlines.
+        Build the (subject, message) pair for a deadline reminder.
         target_type: 'task', 'sprint', 'milestone', 'project'
         """
         type_labels = {
@@ -113,7 +128,6 @@ ClickPM Team
         }
 
         label = type_labels.get(target_type, 'Item')
-        name = getattr(target, 'title', None) or getattr(target, 'name', 'Unknown')
 
         if days_until == 0:
             time_text = "today"
@@ -124,12 +138,12 @@ ClickPM Team
 
         subject = f"[ClickPM] Deadline Reminder: {label} '{name}' due {time_text}"
 
-        message = f"""Hi {user.username},
+        message = f"""Hi {username},
 
 This is a reminder that the following {label.lower()} is due {time_text}:
 
 {label}: {name}
-Due Date: {getattr(target, 'due_date', None) or getattr(target, 'end_date', 'N/A')}
+Due Date: {due_date or 'N/A'}
 
 Please ensure all work is completed before the deadline.
 
@@ -139,7 +153,7 @@ Best regards,
 ClickPM Team
 """
 
-        return EmailService.send_email(user.email, subject, message)
+        return subject, message
 
     @staticmethod
     def send_mention_email(user, actor, comment, target):
@@ -164,7 +178,7 @@ Best regards,
 ClickPM Team
 """
 
-        return EmailService.send_email(user.email, subject, message)
+        return EmailService.queue_email(user.email, subject, message)
 
     @staticmethod
     def send_comment_email(user, actor, comment, target):
@@ -187,7 +201,7 @@ Best regards,
 ClickPM Team
 """
 
-        return EmailService.send_email(user.email, subject, message)
+        return EmailService.queue_email(user.email, subject, message)
 
     @staticmethod
     def send_project_invitation_email(user, project, inviter):
@@ -211,7 +225,7 @@ Best regards,
 ClickPM Team
 """
 
-        return EmailService.send_email(user.email, subject, message)
+        return EmailService.queue_email(user.email, subject, message)
 
     @staticmethod
     def send_bulk_email(recipients, subject, message):
@@ -234,3 +248,30 @@ ClickPM Team
             'failure': failure_count,
             'total': len(recipients),
         }
+
+    @staticmethod
+    def send_mass_email(messages):
+        """
+        Send many individual emails over a single connection.
+        messages: iterable of (to_email, subject, message) tuples.
+        Returns the number of emails sent.
+        """
+        if not EmailService.is_enabled():
+            logger.info("Email notifications disabled. Skipping mass email")
+            return 0
+
+        datatuple = [
+            (subject, message, settings.DEFAULT_FROM_EMAIL, [to_email])
+            for to_email, subject, message in messages
+            if to_email
+        ]
+        if not datatuple:
+            return 0
+
+        try:
+            sent = send_mass_mail(datatuple, fail_silently=False)
+            logger.info(f"Mass email sent: {sent} messages")
+            return sent
+        except Exception as e:
+            logger.error(f"Failed to send mass email: {e}")
+            return 0
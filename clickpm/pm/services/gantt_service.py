@@ -1,3 +1,5 @@
+from django.db.models import Prefetch
+
 from pm.models import Project, Milestone, Sprint, Task, TaskDependency
 
 
@@ -13,6 +15,23 @@ def get_timeline_data(project_id):
 
     items = []
 
+    # Count the sprints' tasks once and average upwards, instead of letting
+    # every milestone and the project recount the same sprints. Same simple
+    # averages as the models' calculate_completion_percentage().
+    milestones = list(project.milestones.order_by('start_date').prefetch_related(
+        Prefetch('sprints', queryset=Sprint.objects.order_by('start_date'))
+    ))
+    sprint_progress = Sprint.completion_percentages(
+        [sprint.id for milestone in milestones for sprint in milestone.sprints.all()]
+    )
+    milestone_progress = {}
+    for milestone in milestones:
+        sprints = [sprint_progress[sprint.id] for sprint in milestone.sprints.all()]
+        milestone_progress[milestone.id] = sum(sprints) / len(sprints) if sprints else 0.0
+    project_progress = (
+        sum(milestone_progress.values()) / len(milestone_progress) if milestone_progress else 0.0
+    )
+
     # Project bar
     items.append({
         'id': f'project-{project.id}',
@@ -20,7 +39,7 @@ def get_timeline_data(project_id):
         'name': project.name,
         'start_date': project.start_date.isoformat() if project.start_date else None,
         'end_date': project.end_date.isoformat() if project.end_date else None,
-        'progress': round(project.calculate_completion_percentage(), 1),
+        'progress': round(project_progress, 1),
         'status': project.status,
         'parent_id': None,
         'level': 0,
@@ -28,14 +47,14 @@ def get_timeline_data(project_id):
     })
 
     # Milestones
-    for milestone in project.milestones.all().order_by('start_date'):
+    for milestone in milestones:
         items.append({
             'id': f'milestone-{milestone.id}',
             'type': 'milestone',
             'name': milestone.name,
             'start_date': milestone.start_date.isoformat() if milestone.start_date else None,
             'end_date': milestone.end_date.isoformat() if milestone.end_date else None,
-            'progress': round(milestone.calculate_completion_percentage(), 1),
+            'progress': round(milestone_progress[milestone.id], 1),
             'status': milestone.status,
             'parent_id': f'project-{project.id}',
             'level': 1,
@@ -43,14 +62,14 @@ def get_timeline_data(project_id):
         })
 
         # Sprints
-        for sprint in milestone.sprints.all().order_by('start_date'):
+        for sprint in milestone.sprints.all():
             items.append({
                 'id': f'sprint-{sprint.id}',
                 'type': 'sprint',
                 'name': sprint.name,
                 'start_date': sprint.start_date.isoformat() if sprint.start_date else None,
                 'end_date': sprint.end_date.isoformat() if sprint.end_date else None,
-                'progress': round(sprint.calculate_completion_percentage(), 1),
+                'progress': round(sprint_progress[sprint.id], 1),
                 'status': sprint.status,
                 'parent_id': f'milestone-{milestone.id}',
                 'level': 2,
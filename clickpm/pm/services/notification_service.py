@@ -46,8 +46,9 @@ class NotificationService:
         }
 
         if target:
-            content_type = ContentType.objects.get_for_model(target)
-            notification_data['target_content_type'] = content_type
+            # get_for_model is served from ContentType's per-process cache;
+            # store the id so the instance is not attached to the row
+            notification_data['target_content_type_id'] = ContentType.objects.get_for_model(target).id
             notification_data['target_object_id'] = target.id
 
         notification = Notification.objects.create(**notification_data)
@@ -90,7 +91,7 @@ Best regards,
 CuriousPMO Team
 """
 
-            EmailService.send_email(recipient.email, subject, message)
+            EmailService.queue_email(recipient.email, subject, message)
         except Exception as e:
             logger.error(f"Failed to send notification email: {e}")
 
@@ -221,32 +222,57 @@ CuriousPMO Team
         return notifications
 
     @staticmethod
-    def notify_deadline(recipient, target, target_type, days_until=1):
-        """
-        Create deadline notification and send email.
-        """
-        name = getattr(target, 'title', None) or getattr(target, 'name', 'Unknown')
-
+    def _deadline_verb(name, target_type, days_until):
         if days_until == 0:
-            verb = f'{target_type.capitalize()} "{name}" is due today'
+            return f'{target_type.capitalize()} "{name}" is due today'
         elif days_until == 1:
-            verb = f'{target_type.capitalize()} "{name}" is due tomorrow'
-        else:
-            verb = f'{target_type.capitalize()} "{name}" is due in {days_until} days'
+            return f'{target_type.capitalize()} "{name}" is due tomorrow'
+        return f'{target_type.capitalize()} "{name}" is due in {days_until} days'
 
-        notification = NotificationService.create_notification(
-            recipient=recipient,
-            verb=verb,
-            notification_type='deadline',
-            actor=None,  # System notification
-            target=target,
-            send_email=True
-        )
+    @staticmethod
+    def bulk_notify_deadline(deadlines, days_until=1, send_email=True):
+        """
+        Create many deadline notifications with batched INSERTs, then send
+        the reminder emails over a single connection.
 
-        # Send specific deadline email
-        EmailService.send_deadline_reminder_email(recipient, target, target_type, days_until)
+        Works on plain values rather than model instances so callers can
+        feed it straight from .values() querysets.
 
-        return notification
+        Args:
+            deadlines: Iterable of (recipient, target, target_type, content_type) tuples,
+                where recipient is a dict with 'id', 'username' and 'email' and
+                target is a dict with 'id', 'name' and 'due_date'
+            days_until: Days until the deadline
+            send_email: Whether to also send the deadline reminder emails
+
+        Returns:
+            List of created Notification objects
+        """
+        notifications = []
+        emails = []
+
+        for recipient, target, target_type, content_type in deadlines:
+            notifications.append(Notification(
+                recipient_id=recipient['id'],
+                verb=NotificationService._deadline_verb(target['name'], target_type, days_until),
+                notification_type='deadline',
+                actor=None,  # System notification
+                target_content_type=content_type,
+                target_object_id=target['id'],
+            ))
+            if send_email and recipient['email']:
+                subject, message = EmailService.build_deadline_reminder_email(
+                    recipient['username'], target['name'], target_type, target['due_date'], days_until
+                )
+                emails.append((recipient['email'], subject, message))
+
+        created = Notification.objects.bulk_create(notifications, batch_size=500)
+        logger.info(f"{len(created)} deadline notifications created")
+
+        if emails:
+            EmailService.send_mass_email(emails)
+
+        return created
 
     @staticmethod
     def notify_project_member_added(user, project, inviter):
@@ -228,7 +228,7 @@ class SearchService:
             Q(task__sprint__milestone__project__in=accessible_projects) |
             Q(sprint__milestone__project__in=accessible_projects) |
             Q(project__in=accessible_projects)
-        ).select_related('author', 'task', 'sprint', 'project')[:limit]
+        ).select_related('author', 'task', 'sprint', 'project').order_by('-created_at')[:limit]
 
         return {
             'count': comments.count(),
@@ -0,0 +1,41 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TestCase
+
+from pm.models.activity_models import ActivityLog
+from pm.models.workspace_models import Workspace
+from pm.services.activity_service import log_activity
+from pm.services.audit_service import AuditService
+
+User = get_user_model()
+
+
+class ActivityLogWriteTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='actor', password='pass1234')
+        self.workspace = Workspace.objects.create(name='Workspace', owner=self.user)
+
+    def test_log_is_saved_at_the_call_site(self):
+        with self.assertNumQueries(1):
+            log = AuditService.log_create(
+                self.user, self.workspace,
+                reason='Created for the quarterly planning cycle and the roadmap review',
+            )
+
+        self.assertIsNotNone(log.pk)
+        self.assertIsNotNone(log.timestamp)
+        stored = ActivityLog.objects.get(pk=log.pk)
+        self.assertEqual(stored.entity_name, 'Workspace')
+        self.assertTrue(stored.short_reason.endswith('...'))
+
+    def test_log_rolls_back_with_the_change(self):
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                workspace = Workspace.objects.create(name='Doomed', owner=self.user)
+                log_activity(self.user, workspace, 'created')
+                self.assertEqual(ActivityLog.objects.count(), 1)
+                raise ValueError('boom')
+
+        self.assertFalse(Workspace.objects.filter(name='Doomed').exists())
+        self.assertFalse(ActivityLog.objects.exists())
@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from pm.models.notification_models import Notification
+from pm.models.project_models import Project, ProjectMember, Milestone, Sprint
+from pm.models.task_models import Task
+from pm.models.workspace_models import Workspace, WorkspaceMember
+from pm.services.auto_completion import AutoCompletionService, _mark_completed
+
+User = get_user_model()
+
+
+class AutoCompletionTests(TestCase):
+
+    def setUp(self):
+        today = timezone.now().date()
+        end = today + timedelta(days=30)
+        self.owner = User.objects.create_user(username='owner', password='pass1234')
+        self.member = User.objects.create_user(username='member', password='pass1234')
+
+        self.workspace = Workspace.objects.create(name='Workspace', owner=self.owner)
+        WorkspaceMember.objects.create(workspace=self.workspace, user=self.owner, is_admin=True)
+        WorkspaceMember.objects.create(workspace=self.workspace, user=self.member)
+
+        self.project = Project.objects.create(
+            name='Project', workspace=self.workspace, start_date=today, end_date=end
+        )
+        ProjectMember.objects.create(project=self.project, user=self.owner)
+        ProjectMember.objects.create(project=self.project, user=self.member)
+        self.milestone = Milestone.objects.create(
+            project=self.project, name='Milestone', start_date=today, end_date=end
+        )
+        self.sprint = Sprint.objects.create(
+            milestone=self.milestone, name='Sprint', start_date=today, end_date=end
+        )
+        self.first = Task.objects.create(sprint=self.sprint, title='First')
+        self.second = Task.objects.create(sprint=self.sprint, title='Second')
+
+    def complete(self, task):
+        task.status = 'Done'
+        task.save()
+
+    def assertStatuses(self, sprint, milestone, project):
+        self.assertEqual(Sprint.objects.get(pk=self.sprint.pk).status, sprint)
+        self.assertEqual(Milestone.objects.get(pk=self.milestone.pk).status, milestone)
+        self.assertEqual(Project.objects.get(pk=self.project.pk).status, project)
+
+    def test_open_tasks_leave_the_sprint_alone(self):
+        self.complete(self.first)
+        self.assertStatuses('Not Started', 'Not Started', 'Not Started')
+        self.assertFalse(Notification.objects.exists())
+
+    def test_counts_are_read_in_one_query(self):
+        self.first.status = 'Done'
+        Task.objects.filter(pk=self.first.pk).update(status='Done')
+        with self.assertNumQueries(1):
+            AutoCompletionService.trigger_auto_completion(self.first)
+
+    def test_last_task_completes_the_hierarchy(self):
+        self.complete(self.first)
+        self.complete(self.second)
+
+        self.assertStatuses('Completed', 'Completed', 'Completed')
+        verbs = list(Notification.objects.filter(recipient=self.member).values_list('verb', flat=True))
+        self.assertEqual(len(verbs), 4)
+        self.assertTrue(any(verb.startswith('Sprint "Sprint" auto-completed') for verb in verbs))
+        self.assertTrue(any(verb.startswith('Milestone "Milestone" auto-completed') for verb in verbs))
+        self.assertTrue(any(verb.startswith('Project "Project" auto-completed') for verb in verbs))
+        self.assertTrue(any(verb.startswith('Workspace "Workspace" COMPLETED!') for verb in verbs))
+        self.assertEqual(Notification.objects.filter(recipient=self.owner).count(), 4)
+
+    def test_other_open_sprint_keeps_the_milestone_open(self):
+        other = Sprint.objects.create(
+            milestone=self.milestone, name='Other', start_date=self.sprint.start_date,
+            end_date=self.sprint.end_date
+        )
+        Task.objects.create(sprint=other, title='Open')
+
+        self.complete(self.first)
+        self.complete(self.second)
+
+        self.assertStatuses('Completed', 'Not Started', 'Not Started')
+        self.assertEqual(Notification.objects.count(), 2)
+
+    def test_repeated_trigger_does_not_complete_twice(self):
+        self.complete(self.first)
+        self.complete(self.second)
+        count = Notification.objects.count()
+
+        # A concurrent request that read the same counts loses the UPDATE race
+        AutoCompletionService.trigger_auto_completion(self.second)
+        self.assertEqual(Notification.objects.count(), count)
+
+    def test_mark_completed_flips_once(self):
+        stale = Sprint.objects.get(pk=self.sprint.pk)
+
+        self.assertTrue(_mark_completed(Sprint, self.sprint))
+        self.assertEqual(self.sprint.status, 'Completed')
+
+        self.assertFalse(_mark_completed(Sprint, stale))
+        self.assertEqual(stale.status, 'Not Started')
+        self.assertEqual(Sprint.objects.get(pk=self.sprint.pk).status, 'Completed')
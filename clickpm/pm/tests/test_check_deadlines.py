@@ -0,0 +1,80 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from pm.models.notification_models import Notification
+from pm.models.project_models import Project, ProjectMember, Milestone, Sprint
+from pm.models.task_models import Task
+from pm.models.workspace_models import Workspace
+
+User = get_user_model()
+
+
+@override_settings(EMAIL_NOTIFICATIONS_ENABLED=True)
+class CheckDeadlinesTests(TestCase):
+
+    def setUp(self):
+        today = timezone.now().date()
+        later = today + timedelta(days=30)
+        self.tomorrow = today + timedelta(days=1)
+
+        self.owner = User.objects.create_user(username='owner', email='owner@example.com', password='pass1234')
+        self.assignee = User.objects.create_user(username='assignee', email='assignee@example.com', password='pass1234')
+
+        workspace = Workspace.objects.create(name='Workspace', owner=self.owner)
+        self.project = Project.objects.create(
+            name='Project', workspace=workspace, start_date=today, end_date=later
+        )
+        ProjectMember.objects.create(project=self.project, user=self.owner)
+        ProjectMember.objects.create(project=self.project, user=self.assignee)
+        milestone = Milestone.objects.create(
+            project=self.project, name='Milestone', start_date=today, end_date=later
+        )
+        self.sprint = Sprint.objects.create(
+            milestone=milestone, name='Sprint', start_date=today, end_date=later
+        )
+        self.task = Task.objects.create(
+            sprint=self.sprint, title='Write report', assignee=self.assignee, due_date=self.tomorrow
+        )
+
+    def test_one_email_per_task_deadline(self):
+        call_command('check_deadlines', days=1, stdout=StringIO())
+
+        notification = Notification.objects.get()
+        self.assertEqual(notification.recipient, self.assignee)
+        self.assertEqual(notification.notification_type, 'deadline')
+        self.assertEqual(notification.target_object_id, self.task.id)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['assignee@example.com'])
+        self.assertIn("Task 'Write report' due tomorrow", mail.outbox[0].subject)
+
+    def test_one_email_per_member_for_sprint_deadline(self):
+        Sprint.objects.filter(pk=self.sprint.pk).update(end_date=self.tomorrow)
+        Task.objects.filter(pk=self.task.pk).update(due_date=None)
+
+        call_command('check_deadlines', days=1, stdout=StringIO())
+
+        self.assertEqual(Notification.objects.count(), 2)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            ['assignee@example.com', 'owner@example.com'],
+        )
+
+    def test_rerun_does_not_notify_again(self):
+        call_command('check_deadlines', days=1, stdout=StringIO())
+        call_command('check_deadlines', days=1, stdout=StringIO())
+
+        self.assertEqual(Notification.objects.count(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_no_email_flag_still_creates_notifications(self):
+        call_command('check_deadlines', days=1, no_email=True, stdout=StringIO())
+
+        self.assertEqual(Notification.objects.count(), 1)
+        self.assertEqual(mail.outbox, [])
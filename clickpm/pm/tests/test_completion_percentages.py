@@ -0,0 +1,119 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from pm.models.project_models import Project, Milestone, Sprint
+from pm.models.task_models import Task
+from pm.models.workspace_models import Workspace
+from pm.serializers.project_serializers import MilestoneSerializer, ProjectSerializer, SprintSerializer
+
+User = get_user_model()
+
+
+class CompletionPercentageTests(TestCase):
+    """Batched completion_percentages() must agree with the per-object calculation"""
+
+    def setUp(self):
+        today = timezone.now().date()
+        end = today + timedelta(days=30)
+        owner = User.objects.create_user(username='owner', password='pass1234')
+        workspace = Workspace.objects.create(name='Workspace', owner=owner)
+
+        def milestone(project, name):
+            return Milestone.objects.create(project=project, name=name, start_date=today, end_date=end)
+
+        def sprint(milestone, name, statuses):
+            sprint = Sprint.objects.create(milestone=milestone, name=name, start_date=today, end_date=end)
+            Task.objects.bulk_create([
+                Task(sprint=sprint, title=f'{name} task {i}', status=status)
+                for i, status in enumerate(statuses)
+            ])
+            return sprint
+
+        # Project A: M1 = avg(50, 100) = 75, M2 = 0 (sprint without tasks),
+        # M3 = 0 (no sprints), so A = 25
+        self.project_a = Project.objects.create(name='A', workspace=workspace, start_date=today, end_date=end)
+        self.m1 = milestone(self.project_a, 'M1')
+        self.s1 = sprint(self.m1, 'S1', ['Done', 'To-do'])
+        self.s2 = sprint(self.m1, 'S2', ['Done'])
+        self.m2 = milestone(self.project_a, 'M2')
+        self.s3 = sprint(self.m2, 'S3', [])
+        self.m3 = milestone(self.project_a, 'M3')
+
+        # Project B has no milestones
+        self.project_b = Project.objects.create(name='B', workspace=workspace, start_date=today, end_date=end)
+
+    def test_sprint_percentages(self):
+        sprint_ids = [self.s1.pk, self.s2.pk, self.s3.pk]
+        with self.assertNumQueries(1):
+            percentages = Sprint.completion_percentages(sprint_ids)
+        self.assertEqual(percentages, {self.s1.pk: 50.0, self.s2.pk: 100.0, self.s3.pk: 0.0})
+        for sprint in Sprint.objects.filter(pk__in=sprint_ids):
+            self.assertEqual(sprint.calculate_completion_percentage(), percentages[sprint.pk])
+
+    def test_milestone_percentages(self):
+        milestone_ids = [self.m1.pk, self.m2.pk, self.m3.pk]
+        with self.assertNumQueries(1):
+            percentages = Milestone.completion_percentages(milestone_ids)
+        self.assertEqual(percentages, {self.m1.pk: 75.0, self.m2.pk: 0.0, self.m3.pk: 0.0})
+        self.assertEqual(self.m1.calculate_completion_percentage(), 75.0)
+
+    def test_project_percentages(self):
+        with self.assertNumQueries(1):
+            percentages = Project.completion_percentages([self.project_a.pk, self.project_b.pk])
+        self.assertEqual(percentages, {self.project_a.pk: 25.0, self.project_b.pk: 0.0})
+        self.assertEqual(self.project_a.calculate_completion_percentage(), 25.0)
+        self.assertEqual(self.project_b.calculate_completion_percentage(), 0.0)
+
+    def test_sprint_list_batches_percentages(self):
+        queryset = Sprint.objects.filter(milestone__project=self.project_a).order_by('name')
+        # One query for the sprints, one for all their percentages
+        with self.assertNumQueries(2):
+            data = SprintSerializer(queryset, many=True).data
+        self.assertEqual(
+            [(row['name'], row['completion_percentage']) for row in data],
+            [('S1', 50.0), ('S2', 100.0), ('S3', 0.0)],
+        )
+
+    def test_nested_lists_match_single_serializer(self):
+        projects = Project.objects.order_by('name')
+        listed = ProjectSerializer(projects, many=True).data
+        for row, project in zip(listed, projects):
+            self.assertEqual(row['completion_percentage'], ProjectSerializer(project).data['completion_percentage'])
+
+        milestones = Milestone.objects.filter(project=self.project_a).order_by('name')
+        listed = MilestoneSerializer(milestones, many=True).data
+        self.assertEqual(
+            [(row['name'], row['completion_percentage']) for row in listed],
+            [('M1', 75.0), ('M2', 0.0), ('M3', 0.0)],
+        )
+        self.assertEqual(
+            sorted(sprint['completion_percentage'] for sprint in listed[0]['sprints']),
+            [50.0, 100.0],
+        )
+
+    def test_nested_sprint_lists_are_batched(self):
+        milestones = MilestoneSerializer.setup_eager_loading(
+            Milestone.objects.filter(project=self.project_a).order_by('name')
+        )
+        # Milestones, prefetched sprints, then one percentage query per level
+        with self.assertNumQueries(4):
+            data = MilestoneSerializer(milestones, many=True).data
+        self.assertEqual(
+            [sorted(sprint['completion_percentage'] for sprint in row['sprints']) for row in data],
+            [[50.0, 100.0], [0.0], []],
+        )
+
+    def test_nested_project_lists_are_batched(self):
+        projects = ProjectSerializer.setup_eager_loading(Project.objects.order_by('name'))
+        # Projects, members, milestones and sprints, then one percentage
+        # query each for projects, milestones and sprints
+        with self.assertNumQueries(7):
+            data = ProjectSerializer(projects, many=True).data
+        self.assertEqual([row['completion_percentage'] for row in data], [25.0, 0.0])
+        self.assertEqual(
+            sorted(milestone['completion_percentage'] for milestone in data[0]['milestones']),
+            [0.0, 0.0, 75.0],
+        )
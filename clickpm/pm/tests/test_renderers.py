@@ -0,0 +1,48 @@
+import datetime
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from pm.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """ORJSONRenderer must produce the same bytes as DRF's JSONRenderer"""
+
+    def setUp(self):
+        self.payload = {
+            'id': 7,
+            'title': 'Launch – phase 1',
+            'budget': Decimal('1250.50'),
+            'weight': 0.25,
+            'done': False,
+            'assignee': None,
+            'created_at': datetime.datetime(2026, 10, 16, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'due_at': datetime.datetime(2026, 10, 20, 18, 0, tzinfo=ZoneInfo('Asia/Dhaka')),
+            'due_date': datetime.date(2026, 10, 20),
+            'status_label': gettext_lazy('Completed'),
+            'description': 'line one\u2028line two\u2029end',
+            'counts': {1: 'one', 2: 'two'},
+            'tags': ['api', 'backend'],
+        }
+
+    def assertSameJSON(self, data, renderer_context=None, accepted_media_type=None):
+        expected = JSONRenderer().render(data, accepted_media_type, renderer_context)
+        actual = ORJSONRenderer().render(data, accepted_media_type, renderer_context)
+        self.assertEqual(actual, expected)
+
+    def test_payload_matches_json_renderer(self):
+        self.assertSameJSON(self.payload)
+
+    def test_list_payload_matches_json_renderer(self):
+        self.assertSameJSON([self.payload, {'id': 8, 'budget': Decimal('0.1')}])
+
+    def test_line_separators_are_escaped(self):
+        rendered = ORJSONRenderer().render({'text': '\u2028\u2029'})
+        self.assertEqual(rendered, b'{"text":"\\u2028\\u2029"}')
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
@@ -0,0 +1,72 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from pm.models.access_models import RolePermission
+from pm.models.user_models import Role
+from pm.utils.permission_helpers import (
+    cached_role_permission_types, clear_role_permission_cache, has_role_permission,
+)
+from pm.utils.role_permissions import ROLE_PERMISSIONS
+
+User = get_user_model()
+
+
+class RolePermissionCacheTests(TestCase):
+
+    def setUp(self):
+        # The cache is per process and role ids are reused between tests
+        clear_role_permission_cache()
+        self.role = Role.objects.create(name='Editor')
+        RolePermission.objects.create(role=self.role, permission_type='task.edit')
+
+    def test_repeated_lookups_are_cached(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(cached_role_permission_types(self.role.pk), {'task.edit'})
+        with self.assertNumQueries(0):
+            self.assertEqual(cached_role_permission_types(self.role.pk), {'task.edit'})
+
+    def test_has_role_permission_uses_the_role_id(self):
+        user = User.objects.create_user(username='editor', password='pass1234', role=self.role)
+        user = User.objects.get(pk=user.pk)
+        cached_role_permission_types(self.role.pk)
+
+        # Neither the Role nor its permissions are loaded again
+        with self.assertNumQueries(0):
+            self.assertTrue(has_role_permission(user, 'task.edit'))
+            self.assertFalse(has_role_permission(user, 'task.delete'))
+
+        roleless = User.objects.create_user(username='roleless', password='pass1234')
+        self.assertFalse(has_role_permission(roleless, 'task.edit'))
+
+    def test_save_clears_the_cache(self):
+        cached_role_permission_types(self.role.pk)
+        RolePermission.objects.create(role=self.role, permission_type='task.delete')
+        self.assertEqual(cached_role_permission_types(self.role.pk), {'task.edit', 'task.delete'})
+
+    def test_queryset_delete_clears_the_cache(self):
+        cached_role_permission_types(self.role.pk)
+        RolePermission.objects.filter(role=self.role, permission_type='task.edit').delete()
+        self.assertEqual(cached_role_permission_types(self.role.pk), frozenset())
+
+    def test_bulk_create_needs_an_explicit_clear(self):
+        cached_role_permission_types(self.role.pk)
+        RolePermission.objects.bulk_create([RolePermission(role=self.role, permission_type='task.create')])
+        # bulk_create sends no post_save
+        self.assertEqual(cached_role_permission_types(self.role.pk), {'task.edit'})
+
+        clear_role_permission_cache()
+        self.assertEqual(cached_role_permission_types(self.role.pk), {'task.edit', 'task.create'})
+
+    def test_init_roles_clears_the_cache(self):
+        admin = Role.objects.create(name='Admin')
+        self.assertEqual(cached_role_permission_types(admin.pk), frozenset())
+
+        call_command('init_roles', stdout=StringIO())
+
+        self.assertEqual(
+            cached_role_permission_types(admin.pk),
+            set(ROLE_PERMISSIONS['Admin']['permissions']),
+        )
@@ -0,0 +1,91 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from pm.models.project_models import Project, Milestone, Sprint
+from pm.models.task_models import Task
+from pm.models.workspace_models import Workspace
+
+User = get_user_model()
+
+
+@mock.patch('pm.services.auto_completion.auto_complete_on_task_done')
+class TaskStatusTransitionTests(TestCase):
+    """Task.save() triggers auto-completion only on a transition to Done"""
+
+    def setUp(self):
+        today = timezone.now().date()
+        owner = User.objects.create_user(username='owner', password='pass1234')
+        workspace = Workspace.objects.create(name='Workspace', owner=owner)
+        project = Project.objects.create(
+            name='Project', workspace=workspace, start_date=today, end_date=today + timedelta(days=30)
+        )
+        milestone = Milestone.objects.create(
+            project=project, name='Milestone', start_date=today, end_date=today + timedelta(days=30)
+        )
+        self.sprint = Sprint.objects.create(
+            milestone=milestone, name='Sprint', start_date=today, end_date=today + timedelta(days=7)
+        )
+        self.task = Task.objects.create(sprint=self.sprint, title='Task')
+
+    def test_creating_done_task_triggers(self, auto_complete):
+        task = Task.objects.create(sprint=self.sprint, title='Done task', status='Done')
+        auto_complete.assert_called_once_with(task)
+
+    def test_transition_to_done_triggers_without_reselecting(self, auto_complete):
+        task = Task.objects.get(pk=self.task.pk)
+        task.status = 'Done'
+        # The loaded status is reused: only the UPDATE runs
+        with self.assertNumQueries(1):
+            task.save()
+        auto_complete.assert_called_once_with(task)
+
+    def test_saving_done_task_again_does_not_trigger(self, auto_complete):
+        self.task.status = 'Done'
+        self.task.save()
+        self.task.title = 'Renamed'
+        self.task.save()
+
+        task = Task.objects.get(pk=self.task.pk)
+        task.save()
+        self.assertEqual(auto_complete.call_count, 1)
+
+    def test_other_status_changes_do_not_trigger(self, auto_complete):
+        self.task.status = 'In Progress'
+        self.task.save()
+        self.task.status = 'Review'
+        self.task.save()
+        auto_complete.assert_not_called()
+
+    def test_reopened_task_triggers_again(self, auto_complete):
+        self.task.status = 'Done'
+        self.task.save()
+        self.task.status = 'In Progress'
+        self.task.save()
+        self.task.status = 'Done'
+        self.task.save()
+        self.assertEqual(auto_complete.call_count, 2)
+
+    def test_deferred_status_falls_back_to_a_query(self, auto_complete):
+        Task.objects.filter(pk=self.task.pk).update(status='Done')
+        task = Task.objects.only('id', 'title').get(pk=self.task.pk)
+        task.status = 'Done'
+        task.save()
+        auto_complete.assert_not_called()
+
+    def test_refresh_from_db_resets_loaded_status(self, auto_complete):
+        task = Task.objects.get(pk=self.task.pk)
+        Task.objects.filter(pk=task.pk).update(status='Done')
+        task.refresh_from_db()
+        task.save()
+        auto_complete.assert_not_called()
+
+    def test_partial_refresh_keeps_pending_transition(self, auto_complete):
+        task = Task.objects.get(pk=self.task.pk)
+        task.status = 'Done'
+        task.refresh_from_db(fields=['title'])
+        task.save()
+        auto_complete.assert_called_once_with(task)
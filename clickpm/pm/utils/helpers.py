@@ -0,0 +1,21 @@
+import sys
+
+
+def intern_choices(field_names, values, choice_fields):
+    """
+    Intern the loaded values of small-vocabulary choice fields so every row
+    shares one string per choice. Meant for a model's from_db() hook.
+    """
+    values = list(values)
+    for name in choice_fields:
+        if name in field_names:
+            i = field_names.index(name)
+            if values[i] is not None:
+                values[i] = sys.intern(values[i])
+    return values
+
+
+def eager_load(queryset, serializer_class):
+    """Apply serializer_class.setup_eager_loading() to queryset, if it defines one"""
+    setup_eager_loading = getattr(serializer_class, 'setup_eager_loading', None)
+    return setup_eager_loading(queryset) if setup_eager_loading else queryset
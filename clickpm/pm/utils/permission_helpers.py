@@ -2,7 +2,12 @@
 Permission helper utilities for consistent permission checks across the application.
 These functions provide reusable permission logic for views, serializers, and services.
 """
+import time
+from functools import lru_cache
+
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from pm.models.workspace_models import Workspace, WorkspaceMember
 from pm.models.project_models import Project, ProjectMember
 from pm.models.access_models import WorkspaceProjectAccess, RolePermission
@@ -188,11 +193,45 @@ def has_role_permission(user, permission_type):
     """
     Check if user's role has a specific permission.
     """
-    if not user.role:
+    # role_id is on the user row already; user.role would fetch the Role
+    if not user.role_id:
         return False
-        
-    return RolePermission.objects.filter(
-        role=user.role,
-        permission_type=permission_type
-    ).exists()
+
+    return permission_type in cached_role_permission_types(user.role_id)
+
+
+# Upper bound, in seconds, on how long another process may serve a cached
+# permission set after it changed; the saving process drops its copy at once.
+ROLE_PERMISSIONS_TTL = 60
+
+
+def cached_role_permission_types(role_id):
+    """
+    Get the frozenset of permission types granted to a role.
+    Cached per process, so repeated checks cost no queries.
+
+    RolePermission signals clear the cache on save and delete. Code that
+    bulk-creates or queryset-deletes rows also calls
+    clear_role_permission_cache() explicitly.
+    """
+    return _cached_role_permissions(role_id, int(time.monotonic() // ROLE_PERMISSIONS_TTL))
+
+
+@lru_cache(maxsize=256)
+def _cached_role_permissions(role_id, ttl_bucket):
+    # ttl_bucket only varies the cache key, expiring entries every TTL
+    return frozenset(
+        RolePermission.objects.filter(role_id=role_id).values_list('permission_type', flat=True)
+    )
+
+
+def clear_role_permission_cache():
+    """Drop this process's cached role permission sets"""
+    _cached_role_permissions.cache_clear()
+
+
+@receiver(post_save, sender=RolePermission)
+@receiver(post_delete, sender=RolePermission)
+def _clear_role_permissions_cache(sender, **kwargs):
+    clear_role_permission_cache()
 
@@ -39,7 +39,7 @@ class CommentViewSet(viewsets.ModelViewSet):
         """
         Get comments created by the current user.
         """
-        comments = Comment.objects.filter(author=request.user)
+        comments = Comment.objects.filter(author=request.user).order_by('-created_at')
         serializer = CommentSerializer(comments, many=True, context={'request': request})
         return Response(serializer.data)
 
@@ -55,7 +55,7 @@ class CommentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        comments = Comment.objects.filter(task_id=task_id)
+        comments = Comment.objects.filter(task_id=task_id).order_by('-created_at')
         serializer = CommentSerializer(comments, many=True, context={'request': request})
         return Response(serializer.data)
 
@@ -71,7 +71,7 @@ class CommentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        comments = Comment.objects.filter(sprint_id=sprint_id)
+        comments = Comment.objects.filter(sprint_id=sprint_id).order_by('-created_at')
         serializer = CommentSerializer(comments, many=True, context={'request': request})
         return Response(serializer.data)
 
@@ -87,7 +87,7 @@ class CommentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        comments = Comment.objects.filter(project_id=project_id)
+        comments = Comment.objects.filter(project_id=project_id).order_by('-created_at')
         serializer = CommentSerializer(comments, many=True, context={'request': request})
         return Response(serializer.data)
 
@@ -120,15 +120,20 @@ class CommentViewSet(viewsets.ModelViewSet):
         elif comment.project:
             target = comment.project
         
-        # Create notification for each mentioned user
-        for user in mentioned_users:
-            if user != comment.author:  # Don't notify yourself
-                Notification.objects.create(
-                    recipient=user,
-                    actor=comment.author,
-                    verb=f'mentioned you in a comment',
-                    notification_type='mention',
-                    target_content_type=ContentType.objects.get_for_model(target) if target else None,
-                    target_object_id=target.id if target else None
-                )
+        # Resolve the target's content type once, not per mentioned user
+        content_type_id = ContentType.objects.get_for_model(target).id if target else None
+
+        # Create notification for each mentioned user, in one INSERT
+        Notification.objects.bulk_create([
+            Notification(
+                recipient=user,
+                actor=comment.author,
+                verb=f'mentioned you in a comment',
+                notification_type='mention',
+                target_content_type_id=content_type_id,
+                target_object_id=target.id if target else None
+            )
+            for user in mentioned_users
+            if user != comment.author  # Don't notify yourself
+        ])
 
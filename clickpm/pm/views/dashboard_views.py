@@ -536,9 +536,11 @@ class DashboardViewSet(viewsets.ViewSet):
         """
         user = request.user
 
-        # Get recent activity for this user
+        # Get recent activity for this user; skip the JSON audit payloads
         recent_activities = ActivityLog.objects.filter(
             user=user
+        ).select_related(None).only(
+            'content_type', 'object_id', 'action', 'timestamp'
         ).order_by('-timestamp')[:20]
 
         # Track unique items
@@ -622,19 +624,20 @@ class DashboardViewSet(viewsets.ViewSet):
         # Get accessible projects
         accessible_projects = get_accessible_projects(user)
 
-        # Get tasks assigned to user
+        # Get tasks assigned to user; only the project name and status are read
         user_tasks = Task.objects.filter(
             assignee=user,
             sprint__milestone__project__in=accessible_projects
-        ).select_related('sprint__milestone__project')
+        ).values_list('sprint__milestone__project__name', 'status')
 
         # Calculate stats by project
         project_stats = {}
         total_tasks = 0
         total_completed = 0
 
-        for task in user_tasks:
-            project_name = task.sprint.milestone.project.name if task.sprint and task.sprint.milestone and task.sprint.milestone.project else 'Unassigned'
+        # Stream the rows instead of caching the whole result set
+        for project_name, task_status in user_tasks.iterator(chunk_size=2000):
+            project_name = project_name or 'Unassigned'
 
             if project_name not in project_stats:
                 project_stats[project_name] = {
@@ -646,10 +649,10 @@ class DashboardViewSet(viewsets.ViewSet):
             project_stats[project_name]['total'] += 1
             total_tasks += 1
 
-            if task.status == 'Done':
+            if task_status == 'Done':
                 project_stats[project_name]['completed'] += 1
                 total_completed += 1
-            elif task.status == 'In Progress':
+            elif task_status == 'In Progress':
                 project_stats[project_name]['in_progress'] += 1
 
         # Convert to list
@@ -1089,7 +1092,7 @@ class DashboardViewSet(viewsets.ViewSet):
             # Last activity
             last_activity = ActivityLog.objects.filter(
                 extra_info__workspace_id=workspace.id
-            ).order_by('-timestamp').first()
+            ).only('action', 'timestamp', 'user__username').order_by('-timestamp').first()
             
             # Member count
             member_count = WorkspaceMember.objects.filter(workspace=workspace).count()
@@ -1164,11 +1167,18 @@ class DashboardViewSet(viewsets.ViewSet):
         if workspace_id:
             projects = projects.filter(workspace_id=workspace_id)
 
+        projects = list(projects.prefetch_related('milestones'))
+        # One query per level instead of one per project and milestone
+        project_completions = Project.completion_percentages([project.id for project in projects])
+        milestone_completions = Milestone.completion_percentages(
+            [milestone.id for project in projects for milestone in project.milestones.all()]
+        )
+
         project_data = []
-        for project in projects.prefetch_related('milestones', 'milestones__sprints', 'milestones__sprints__tasks'):
-            project_completion = project.calculate_completion_percentage()
+        for project in projects:
+            project_completion = project_completions[project.id]
             milestones = project.milestones.all()
-            completed_milestones = sum(1 for m in milestones if m.calculate_completion_percentage() == 100)
+            completed_milestones = sum(1 for m in milestones if milestone_completions[m.id] == 100)
             
             all_tasks = Task.objects.filter(sprint__milestone__project=project)
             total_tasks = all_tasks.count()
@@ -1259,11 +1269,18 @@ class DashboardViewSet(viewsets.ViewSet):
         if project_id:
             milestones = milestones.filter(project_id=project_id)
 
+        milestones = list(milestones.prefetch_related('sprints'))
+        # One query per level instead of one per milestone and sprint
+        milestone_completions = Milestone.completion_percentages([milestone.id for milestone in milestones])
+        sprint_completions = Sprint.completion_percentages(
+            [sprint.id for milestone in milestones for sprint in milestone.sprints.all()]
+        )
+
         milestone_data = []
-        for milestone in milestones.prefetch_related('sprints', 'sprints__tasks'):
-            milestone_completion = milestone.calculate_completion_percentage()
+        for milestone in milestones:
+            milestone_completion = milestone_completions[milestone.id]
             sprints = milestone.sprints.all()
-            completed_sprints = sum(1 for s in sprints if s.calculate_completion_percentage() == 100)
+            completed_sprints = sum(1 for s in sprints if sprint_completions[s.id] == 100)
             
             all_tasks = Task.objects.filter(sprint__milestone=milestone)
             total_tasks = all_tasks.count()
@@ -1349,9 +1366,12 @@ class DashboardViewSet(viewsets.ViewSet):
         if project_id:
             sprints = sprints.filter(milestone__project_id=project_id)
 
+        sprints = list(sprints.prefetch_related('tasks'))
+        sprint_completions = Sprint.completion_percentages([sprint.id for sprint in sprints])
+
         sprint_data = []
-        for sprint in sprints.prefetch_related('tasks'):
-            sprint_completion = sprint.calculate_completion_percentage()
+        for sprint in sprints:
+            sprint_completion = sprint_completions[sprint.id]
             all_tasks = sprint.tasks.all()
             total_tasks = all_tasks.count()
             completed_tasks = all_tasks.filter(status='Done').count()
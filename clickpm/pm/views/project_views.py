@@ -14,6 +14,7 @@ from pm.serializers.project_serializers import (
     SprintSerializer, SprintCreateUpdateSerializer
 )
 from pm.permissions import IsProjectMember, CanViewProject
+from pm.utils.helpers import eager_load
 from pm.utils.permission_helpers import get_accessible_projects
 from pm.services.audit_service import AuditService, EventType
 from pm.services.kanban_service import get_kanban_for_project, get_kanban_for_sprint
@@ -31,7 +32,10 @@ class ProjectViewSet(viewsets.ModelViewSet):
     ordering = ['-id']
 
     def get_queryset(self):
-        return get_accessible_projects(self.request.user)
+        queryset = get_accessible_projects(self.request.user)
+        if self.action in ['list', 'retrieve']:
+            queryset = eager_load(queryset, self.get_serializer_class())
+        return queryset
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -192,7 +196,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         """
         Get projects where the current user is a member.
         """
-        projects = Project.objects.filter(members=request.user)
+        projects = ProjectSerializer.setup_eager_loading(Project.objects.filter(members=request.user))
         serializer = ProjectSerializer(projects, many=True, context={'request': request})
         return Response(serializer.data)
 
@@ -362,7 +366,10 @@ class MilestoneViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Filter milestones to only those from accessible projects"""
         accessible_projects = get_accessible_projects(self.request.user)
-        return Milestone.objects.filter(project__in=accessible_projects)
+        queryset = Milestone.objects.filter(project__in=accessible_projects)
+        if self.action in ['list', 'retrieve']:
+            queryset = eager_load(queryset, self.get_serializer_class())
+        return queryset
 
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
@@ -6,6 +6,7 @@ from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from pm.models.user_models import Role
 from pm.models.access_models import RolePermission
 from pm.serializers.access_serializers import RolePermissionSerializer
+from pm.utils.permission_helpers import clear_role_permission_cache
 
 class RoleViewSet(viewsets.ModelViewSet):
     """
@@ -80,6 +81,7 @@ class RoleViewSet(viewsets.ModelViewSet):
             role=role,
             permission_type=permission_type
         ).delete()
+        clear_role_permission_cache()
         
         if deleted_count > 0:
             return Response({'status': 'Permission revoked'})
@@ -14,6 +14,7 @@ from pm.serializers.task_serializers import (
     TaskDependencySerializer, TaskDependencyCreateUpdateSerializer
 )
 from pm.permissions import IsTaskAssignee, CanViewProject
+from pm.utils.helpers import eager_load
 from pm.services.audit_service import AuditService, EventType
 from pm.services.kanban_service import get_kanban_for_user
 from pm.services.notification_service import NotificationService
@@ -46,6 +47,8 @@ class TaskViewSet(viewsets.ModelViewSet):
         if project_id:
             queryset = queryset.filter(sprint__milestone__project_id=project_id)
 
+        if self.action in ['list', 'retrieve']:
+            queryset = eager_load(queryset, self.get_serializer_class())
         return queryset
 
     def get_serializer_class(self):
@@ -160,13 +163,13 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['GET'])
     def my_tasks(self, request):
-        tasks = Task.objects.filter(assignee=request.user)
+        tasks = TaskSerializer.setup_eager_loading(Task.objects.filter(assignee=request.user))
         serializer = TaskSerializer(tasks, many=True, context={'request': request})
         return Response(serializer.data)
 
     @action(detail=False, methods=['GET'])
     def reported_by_me(self, request):
-        tasks = Task.objects.filter(reporter=request.user)
+        tasks = TaskSerializer.setup_eager_loading(Task.objects.filter(reporter=request.user))
         serializer = TaskSerializer(tasks, many=True, context={'request': request})
         return Response(serializer.data)
 
@@ -229,7 +232,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         })
 
 class TaskDependencyViewSet(viewsets.ModelViewSet):
-    queryset = TaskDependency.objects.all()
+    queryset = TaskDependency.objects.select_related('depends_on')
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['task', 'depends_on', 'type']
@@ -22,6 +22,7 @@ from pm.serializers.access_serializers import (
     GrantProjectAccessSerializer
 )
 from pm.permissions import IsWorkspaceMember, IsWorkspaceAdmin
+from pm.utils.helpers import eager_load
 from pm.services.audit_service import AuditService, EventType
 
 
@@ -41,10 +42,14 @@ class WorkspaceViewSet(viewsets.ModelViewSet):
         Superusers can see all workspaces."""
         user = self.request.user
         if user.is_superuser:
-            return Workspace.objects.all()
-        return Workspace.objects.filter(
-            Q(owner=user) | Q(members=user)
-        ).distinct()
+            queryset = Workspace.objects.all()
+        else:
+            queryset = Workspace.objects.filter(
+                Q(owner=user) | Q(members=user)
+            ).distinct()
+        if self.action in ['list', 'retrieve', 'my_workspaces']:
+            queryset = eager_load(queryset, self.get_serializer_class())
+        return queryset
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -227,7 +232,7 @@ class WorkspaceViewSet(viewsets.ModelViewSet):
         accessible_projects = get_accessible_projects(user)
         
         # Filter to projects in this workspace
-        projects = accessible_projects.filter(workspace=workspace)
+        projects = ProjectSerializer.setup_eager_loading(accessible_projects.filter(workspace=workspace))
 
         serializer = ProjectSerializer(projects, many=True, context={'request': request})
         return Response(serializer.data)